@@ -450,10 +450,13 @@ def construct_html_sections(loaded_parms, jinja_template_variables, head, body):
     #   * break for a paragraph that is not a TOC-entry
     for i in range(num_empty_paragraphs, len(all_paragraphs)):
         paragraph = all_paragraphs[i]
-        if ( (not 'class' in paragraph.attrs) or (len(paragraph['class']) != 1) ):
+        # * The class list is looked-up once, and kept in a local variable.
+        #   Each paragraph['class'] is a look-up in the tag's attribute dictionary.
+        paragraph_classes = paragraph.attrs.get('class')
+        if ( (paragraph_classes == None) or (len(paragraph_classes) != 1) ):
             break
         # Check if the class is "MsoToc" followed by a single digit
-        paragraph_class = paragraph['class'][0]
+        paragraph_class = paragraph_classes[0]
         result = re.search(regex, paragraph_class, re.M)
         if (result == None):
             break
@@ -506,7 +509,7 @@ def construct_html_sections(loaded_parms, jinja_template_variables, head, body):
         # Test if the paragraph has a <span> tag with the attribute class=MsoHyperlink
         span = paragraph.find('span', class_="MsoHyperlink")
         if (span != None):
-            span['class'].append('tocAnchor')
+            span.attrs.setdefault('class', []).append('tocAnchor')
 
         # * Usually there is just one anchor tag, but there can be more.
         # * When there are multiple anchor-tags in a TOC entry:
@@ -522,9 +525,8 @@ def construct_html_sections(loaded_parms, jinja_template_variables, head, body):
 
         for parent in paragraph_string.parents:
             if (parent.name == "a"):
-                if not ('class' in parent.attrs):
-                    parent['class'] = []
-                parent['class'].append('tocAnchor')
+                # setdefault() adds an empty class list, if the anchor tag has no class attribute
+                parent.attrs.setdefault('class', []).append('tocAnchor')
                 break
             elif (parent.name == "p"):
                 toc_entries_without_hyperlink += 1
@@ -534,7 +536,9 @@ def construct_html_sections(loaded_parms, jinja_template_variables, head, body):
         print("INFO.  Table-of-contents entries without a hyperlink: " + str(toc_entries_without_hyperlink))
 
     # Create a string variable with the TOC entries, in HTML text-format.
-    toc_html = soup_toc.decode(formatter="html")
+    # * The "minimal" formatter is used, as for the document-text in fix_word_html().
+    #   It only escapes the characters &, < and >.
+    toc_html = soup_toc.decode(formatter="minimal")
 
     # Jinja will be used to put toc_html in the output HTML
     jinja_template_variables['table_of_contents'] = toc_html
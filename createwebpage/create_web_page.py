@@ -137,7 +137,7 @@ def create_web_page_core(parameter_file_path: str,
         # Data returned in returned_objects_dict:
         
         # The Jinja template is loaded from a file, and returned in jinja_template
-        # * jinja_template is a jinja2 object, created by calling jinja2.Template() 
+        # * jinja_template is a jinja2 Template object
         jinja_template = returned_objects_dict["jinja_template"]
         
         # The input Word HTML-file was loaded, and it is returned in BeautifulSoup objects:
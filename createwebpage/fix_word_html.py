@@ -5,14 +5,28 @@
 
 Local functions:
 * fix_unordered_list_items()
+* remove_color_white_from_style()
+* classify_unordered_list_item()
+* parse_style_attribute()
+* serialize_style_attribute()
+* get_list_item_strings()
+* get_first_strings()
 * test_if_span_with_only_spaces()
 
 Call graph:
   create_web_page_core()
     --> fix_word_html()
           --> fix_unordered_list_items()
-                --> test_if_span_with_only_spaces()
+                --> classify_unordered_list_item()
+                      --> parse_style_attribute()
+                      --> get_first_strings()
+                      --> test_if_span_with_only_spaces()
+          --> get_list_item_strings()
+                --> get_first_strings()
           --> test_if_span_with_only_spaces()
+          --> parse_style_attribute()
+          --> serialize_style_attribute()
+          --> remove_color_white_from_style()
 
 MIT License, Copyright (c) 2021-present Jim Yuill
 ################
@@ -26,7 +40,8 @@ from input_parameter_file_keys import *
 
 try:
     # BeautifulSoup:  pip install beautifulsoup4
-    from bs4 import BeautifulSoup, NavigableString, Tag
+    from bs4 import NavigableString, Tag
+    from bs4.element import PreformattedString
 except ImportError as e:
     print("")
     print("ERROR.  Could not import a required Python module.")
@@ -45,15 +60,13 @@ except ImportError as e:
 
 # Defines the keys used in the dictionary HTML_ENTITY_ENCODING_SPECS
 FIX_KEY_DESCRIPTION = "description"
-FIX_KEY_ENCODE = "encode"
-FIX_KEY_DECODE = "decode"
+FIX_KEY_REPLACEMENT = "replacement"
 FIX_KEY_NUMBER_ENCODED = "number_encoded"
 
 # A dictionary used to store the data used to fix a particular bug
 HTML_ENTITY_ENCODING_SPECS = {
     FIX_KEY_DESCRIPTION: "",  # Constant, used in console messages
-    FIX_KEY_ENCODE: "",  # Constant, specifies the new HTML, within a script tag
-    FIX_KEY_DECODE: "",  # Constant, specifies the new HTML, without the script tag
+    FIX_KEY_REPLACEMENT: "",  # Constant, specifies the new text ("" if no replacement is needed)
     FIX_KEY_NUMBER_ENCODED: 0  # Variable, specifies the number of instances of the fix
 }
 
@@ -63,13 +76,67 @@ FIX_KEY_SOLID_SQUARE_BULLET = "solid_square_bullet"
 FIX_KEY_LETTER_O_BULLET = "letter_o_bullet"
 FIX_KEY_SIX_NBSPS = "six_nbsps"
 
-# Defines HTML tags that are used in the dictionary html_entity_encodings
-# * The fixes to the Word-HTML involves replacing HTML strings with particular
-#   HTML entities.
-# * Those replacement HTML-entities are put inside script opening and closing tags,
-#   which are defined here.
-FIX_SCRIPT_OPENING_TAG = "<script type=\"word_web_page_nav\">"
-FIX_SCRIPT_CLOSING_TAG = "</script>"
+# Specifies the bullet-symbols of the unordered-list list-items that are fixed
+# * Each bullet-symbol is specified by its font-family and its symbol.
+# * Each bullet-symbol's value is its top-level key in the dictionary html_entity_encodings.
+# * Encoding for symbols:
+#   * Apparently, my editor changes the following symbols from 1-byte encoding to 2-byte encoding:
+#     * Solid-dot bullet symbols, changed to "Â·"
+#     * Solid-square bullet symbols, changed to ""Â§"
+#   * So, the ASCII value is specified for these symbols, e.g., chr(183)
+UNORDERED_LIST_BULLET_SYMBOLS = {
+    # Solid-dot bullet symbols
+    # * Word's solid-dot bullet is not displayed properly by Firefox.
+    #   * It is replaced by the solid-dot symbol, chr(9679), i.e., the HTML entity "&#9679;"
+    ("Symbol", chr(183)): FIX_KEY_SOLID_DOT_BULLET,
+    # Solid-square bullet symbols
+    # * Word's solid-square bullet is not displayed properly by Firefox.
+    #   * It is replaced by the solid-square symbol, chr(9632), i.e., the HTML entity "&#9632;"
+    ("Wingdings", chr(167)): FIX_KEY_SOLID_SQUARE_BULLET,
+    # Letter-"o" bullet symbols.  Just their spacing is fixed.
+    ('"Courier New"', "o"): FIX_KEY_LETTER_O_BULLET
+}
+
+# The spacing after a list-item's symbol: six non-breaking spaces ("&nbsp;")
+# * It is output as six non-breaking space characters, rather than "&nbsp;" entities.
+SIX_NBSPS = "\xa0" * 6
+
+"""
+##################
+* Global constants, the reg-ex patterns used in editing the Word-HTML
+* Most of the patterns are used for each candidate list-item, or for each span tag.
+  * The patterns are compiled once, when the module is loaded.
+##################
+"""
+
+# The class names of candidate list-item paragraphs, e.g., class=MsoNormal
+LIST_ITEM_CLASS_NAMES = frozenset({
+    "MsoListParagraph",
+    "MsoListParagraphCxSpFirst",
+    "MsoListParagraphCxSpMiddle",
+    "MsoListParagraphCxSpLast",
+    "MsoNormal",
+    "MsoBodyText"
+})
+# CSS selector for paragraphs whose style attribute has a "text-indent" value
+LIST_ITEM_STYLE_SELECTOR = 'p[style*="text-indent:"]'
+
+# Matches the typical types of ordered-list list-item symbols, e.g., [1], 1), and 1.
+REGEX_LIST_ITEM_SYMBOL = re.compile(r'^[\[]?\S+[\)\.\]]$', re.M)
+
+# Matches the value of a style attribute's text-indent property, e.g., "-1.5in"
+# * Group 1 is the text-indent value, without units, e.g., "-1.5"
+# * Group 2 is the units, e.g., "in"
+REGEX_TEXT_INDENT_VALUE = re.compile(r"([+-]?[\.0-9]+)([a-zA-Z]+)$")
+
+# Specifies text whose color is set to white, in a style attribute
+STYLE_COLOR_WHITE = "color:white"
+# Matches a style attribute that includes the value "color:white"
+REGEX_COLOR_WHITE = re.compile(r"(?:^|;)(?:" + STYLE_COLOR_WHITE + ")(?:$|;)", re.M)
+# CSS selector for span tags whose style attribute contains the substring "color:white"
+COLOR_WHITE_SPAN_SELECTOR = 'span[style*="' + STYLE_COLOR_WHITE + '"]'
+# Used to remove "color:white" from a style attribute
+REGEX_COLOR_WHITE_SUBSTITUTION = re.compile(r"((?:^|;)(?:" + STYLE_COLOR_WHITE + ")(?:$|;))", re.M)
 
 
 def test_if_span_with_only_spaces(element):
@@ -79,29 +146,183 @@ def test_if_span_with_only_spaces(element):
 
     Local function, called by:
     * fix_word_html()
-    * fix_unordered_list_items()
+    * classify_unordered_list_item()
     
     Returns True or False
     '''
-    # Have to use .decode() to get the "&nbsp;"s
     if ( isinstance(element, Tag) and (element.name == "span") and
        ('style' in element.attrs) and (len(element.contents) == 1) ):
 
-        span_html_str = element.decode(formatter='html')
-        regex = r"^<span[^>]*?>(?:\s*?(?:&nbsp;)\s*?)+</span>$"
-        search_result = re.search(regex, span_html_str, re.M)
-        if search_result != None:
+        # * The span's string is tested directly, rather than converting the span to HTML text
+        #   and using a reg-ex.
+        # * In the BeautifulSoup string, each "&nbsp;" is the character "\xa0".
+        # * The string is made-up of only spaces if:
+        #   * All its characters are whitespace, and
+        #   * At least one character is "\xa0"
+        # * str.isspace() tests all the characters in one call.  It is True for "\xa0".
+        # * Comments and other PreformattedStrings are not the span's text.
+        span_string = element.contents[0]
+        if ( isinstance(span_string, NavigableString) and 
+             not isinstance(span_string, PreformattedString) and
+             ('\xa0' in span_string) and 
+             span_string.isspace() ):
             return True
 
     return False
 # END OF: test_if_span_with_only_spaces()
 
 
+def get_first_strings(element, limit: int):
+    ''' 
+    For the input HTML-element, get its first strings, in document order
+
+    Local function, called by:
+    * get_list_item_strings()
+    * classify_unordered_list_item()
+
+    * The strings are the same as the first strings in: element.find_all(string=True)
+      * But, find_all() gets all of the element's strings.
+      * Here, the search stops after "limit" strings are found.
+    * The list-item tests only need a paragraph's first two or three strings.
+
+    Returns a Python list, with at most "limit" strings (NavigableString objects)
+    '''
+    first_strings = []
+    for descendant in element.descendants:
+        if isinstance(descendant, NavigableString):
+            first_strings.append(descendant)
+            if len(first_strings) >= limit:
+                break
+    return first_strings
+# END OF: get_first_strings()
+
+
+def get_list_item_strings(paragraph):
+    ''' 
+    For the input HTML-paragraph, get its first three strings, in document order
+
+    Local function, called by: fix_word_html()
+
+    * The strings are the same as from: get_first_strings(paragraph, 3)
+    * An ordered-list list-item's first strings are typically in the paragraph's first
+      children, e.g.:
+        <p ...><span ...>&nbsp;&nbsp;</span>1.<span ...>&nbsp;&nbsp;</span>List-item text</p>
+      * So, the paragraph's children are read directly.  A child is either a string, 
+        or a tag with just a string (e.g., the span tags).
+      * If a child has other contents (e.g., nested tags), get_first_strings() is used.
+
+    Returns a Python list, with at most three strings (NavigableString objects)
+    '''
+    first_strings = []
+    for child in paragraph.contents:
+        if isinstance(child, NavigableString):
+            first_strings.append(child)
+        elif len(child.contents) == 0:
+            continue
+        elif (len(child.contents) == 1) and isinstance(child.contents[0], NavigableString):
+            first_strings.append(child.contents[0])
+        else:
+            return get_first_strings(paragraph, 3)
+        if len(first_strings) >= 3:
+            break
+    return first_strings
+# END OF: get_list_item_strings()
+
+
+def parse_style_attribute(style: str):
+    ''' 
+    Parses an HTML style attribute into a dictionary, e.g., 
+    "font-family:Symbol;color:red" is parsed into {"font-family": "Symbol", "color": "red"}
+
+    Local function, called by:
+    * classify_unordered_list_item()
+    * fix_word_html()
+
+    * The style is split once, and its properties are then looked-up in the dictionary.
+      * This replaces a reg-ex search of the style, for each property tested.
+    * Word-HTML can have a newline between the style's properties, so the property names
+      and values have their surrounding whitespace removed.
+
+    Returns the dictionary
+    '''
+    style_dict = {}
+    for declaration in style.split(';'):
+        if ':' in declaration:
+            property_name, property_value = declaration.split(':', 1)
+            style_dict[property_name.strip()] = property_value.strip()
+    return style_dict
+# END OF: parse_style_attribute()
+
+
+def serialize_style_attribute(style_dict: dict):
+    ''' 
+    Serializes a dictionary from parse_style_attribute() into an HTML style attribute, e.g., 
+    {"font-family": "Symbol", "color": "red"} is serialized into "font-family:Symbol;color:red"
+
+    Local function, called by: fix_word_html()
+
+    * The properties are serialized in the dictionary's order, which is their order in the
+      parsed style attribute.
+
+    Returns the style attribute's string
+    '''
+    return ';'.join(property_name + ':' + property_value 
+                    for property_name, property_value in style_dict.items())
+# END OF: serialize_style_attribute()
+
+
+def classify_unordered_list_item(paragraph):
+    ''' 
+    Determines if the input paragraph is an unordered-list list-item, with one of 
+    the bullet-symbols specified in UNORDERED_LIST_BULLET_SYMBOLS
+
+    Local function, called by:
+    * fix_unordered_list_items()
+
+    Return:
+    * None : the paragraph is not such a list-item
+    * html_entity_encodings_key, first_string, second_string : the paragraph is such a list-item
+      * html_entity_encodings_key : for the bullet-symbol, its key in UNORDERED_LIST_BULLET_SYMBOLS
+      * first_string : the bullet-symbol's string (NavigableString)
+      * second_string : the string with the spaces after the bullet-symbol (NavigableString)
+    '''
+    # A list-item paragraph will have at least two strings
+    # * Only the paragraph's first two strings are used
+    paragraph_strings = get_first_strings(paragraph, 2)
+    if len(paragraph_strings) < 2:
+        return None
+    
+    # For the first string, test if its parent is an HTML span tag with the attribute 'style'
+    first_string = paragraph_strings[0]
+    first_string_parent = first_string.parent
+    if not ( isinstance(first_string_parent, Tag) and (first_string_parent.name == 'span') and 
+             ('style' in first_string_parent.attrs) ):
+        return None
+
+    # Test that the first string and the style attribute's font-family specify one 
+    # of the bullet-symbols
+    # * The style attribute is parsed once, and its font-family is looked-up.
+    font_family = parse_style_attribute(first_string_parent.attrs['style']).get('font-family')
+    html_entity_encodings_key = UNORDERED_LIST_BULLET_SYMBOLS.get((font_family, first_string.string))
+    if html_entity_encodings_key == None:
+        return None
+
+    # Test if the second string is all spaces ("&nbsp;"), within an enclosing span tag
+    second_string = paragraph_strings[1]
+    second_string_parent = second_string.parent
+    if not test_if_span_with_only_spaces(second_string_parent):
+        return None
+
+    # Test if the spaces' enclosing span tag is a child of the bullet-symbol's parent
+    if not (first_string_parent is second_string_parent.parent):
+        return None
+
+    return html_entity_encodings_key, first_string, second_string
+# END OF: classify_unordered_list_item()
+
+
 def fix_unordered_list_items(html_entity_encodings, 
-                             word_list_item_list, 
-                             font_family: str, 
-                             symbol: str, 
-                             html_entity_encodings_key: str):
+                             word_list_item_list):
     ''' 
     Fixes commonly-found bugs in Word-HTML, for unordered-lists.
 
@@ -111,13 +332,13 @@ def fix_unordered_list_items(html_entity_encodings,
     * html_entity_encodings : dictionary, each entry specifies the HTML used to fix
                               a particular bug in the Word-HTML
     * word_list_item_list : a Python list, holds candidate Word list-items
-    * font_family : used in specifying the bullet-symbol of the list-items to be fixed
-    * symbol : used in specifying the bullet-symbol of the list-items to be fixed
-    * html_entity_encodings_key : the HTML for fixing the bullet-symbol, if it needs to be fixed
 
     Return:
-    * html_entity_encodings : Stats are recorded for fixed list-items
-    * word_list_item_list : Fixed list-items are removed from word_list_item_list.
+    * bullets_fixed_count : dictionary, the number of list-items fixed for each type of 
+                            bullet-symbol, keyed by its html_entity_encodings key
+    * Objects passed as parameters:
+      * html_entity_encodings : Stats are recorded for fixed list-items
+      * word_list_item_list : Fixed list-items are removed from word_list_item_list.
     '''
 
     '''
@@ -126,87 +347,67 @@ def fix_unordered_list_items(html_entity_encodings,
         * For the list-items, three types of bullet-symbols are typically used:
           * solid-dot, solid-square, and the letter "o"
 
-    * The function's parameters specify:
-      * The bullet-symbol of the list-item to be fixed, e.g., a round dot
-        * It's specified by the parameters "font_family" and "symbol"
-      * The HTML needed to fix the bullet-symbol, if it needs to be fixed.
-        * The parameter "html_entity_encodings_key" is a key for the dictionary html_entity_encodings.
-        * In the dictionary, that key's value has the HTML for fixing the bug.
+    * The bullet-symbols are specified in the dictionary UNORDERED_LIST_BULLET_SYMBOLS:
+      * A bullet-symbol is specified by a font-family and a symbol.
+      * For each bullet-symbol, the dictionary specifies a key for the dictionary html_entity_encodings.
+        * In the dictionary html_entity_encodings, that key's value has the HTML for fixing 
+          the bullet-symbol, if it needs to be fixed.
           If no fix is needed, the empty string is specified.
 
     * The function examines each candidate Word list-item in the Python list "word_list_item_list".
       * A candidate list-item could be a list-item, but additional examination is needed to confirm that.
       * In HTML, a list-item is specified as a paragraph (<p ...> ... </p>)
-      * If a list-item is for an unordered-list, and it has the specified bullet-symbol, 
+      * If a list-item is for an unordered-list, and it has one of the bullet-symbols, 
         then the list-item's HTML is edited, to fix its bugs.
+      * The three types of bullet-symbols are handled in a single pass over word_list_item_list.
 
-    * The bug-fixes just described involve replacing HTML strings with HTML entities.
-      * The replacements are done in the BeautifulSoup HTML.
-      * During the replacement, BeautifulSoup itself can potentially alter those HTML entities,
-        in undesirable ways.
-      * To prevent BeautifulSoup from making those alternations, the replacement HTML entities
-        are put insides of an HTML <script> tag, e.g., <script>[replacement HTML entities]</script>.
-      * Later in fix_word_html(), the BeautifulSoup HTML will be converted to HTML text.  
-        Those added opening and closing script tags will be removed then, from the HTML text.
+    * The bullet-symbol fixes just described involve replacing HTML strings with new text.
+      * The replacements are done in the BeautifulSoup HTML, by replacing a string 
+        (a NavigableString) with a new string.
+      * The new text is characters, e.g., chr(9679), rather than HTML entities, e.g., "&#9679;".
+        * BeautifulSoup outputs the characters as-is, so no further editing of the HTML text is needed.
 
     * The Word-HTML bugs, and their fixes, are further described in the WWN development-documents.
     '''
 
     list_elements_to_remove = []
 
-    symbol_replace_count = 0
-    bullets_fixed_count = 0
+    # Stats for each type of bullet-symbol, keyed by its html_entity_encodings key
+    symbol_replace_count = {}
+    bullets_fixed_count = {}
+    for html_entity_encodings_key in UNORDERED_LIST_BULLET_SYMBOLS.values():
+        symbol_replace_count[html_entity_encodings_key] = 0
+        bullets_fixed_count[html_entity_encodings_key] = 0
+
+    # The replacement text is looked-up in html_entity_encodings once, before the loop.
+    # * bullet_symbol_replacements: for each type of bullet-symbol, its replacement text
+    #   * The value is "" if no fix is needed for the bullet-symbol.
+    bullet_symbol_replacements = {}
+    for html_entity_encodings_key in UNORDERED_LIST_BULLET_SYMBOLS.values():
+        bullet_symbol_replacements[html_entity_encodings_key] = \
+            html_entity_encodings[html_entity_encodings_key][FIX_KEY_REPLACEMENT]
+
     # Loop for each HTML paragraph in word_list_item_list
     for word_list_item_list_index in range(0, len(word_list_item_list)):
         '''
         * Determine if the paragraph is an unordered-list list-item, 
-          and if it has the required bullet-symbol.
+          and which bullet-symbol it has.
         '''
-        
-        # A list-item paragraph will have at least two strings
         paragraph = word_list_item_list[word_list_item_list_index]
-        paragraph_strings = paragraph.find_all(string=True)
-        if len(paragraph_strings) < 2:
-            continue
-        
-        # Test that the first string is the required bullet-symbol
-        first_string = paragraph_strings[0]
-        if (first_string.string != symbol):
-            continue
-
-        # For the bullet-symbol, test if its parent is an HTML span tag with the attribute 'style'
-        first_string_parent = first_string.parent
-        if not ( isinstance(first_string_parent, Tag) and (first_string_parent.name == 'span') and 
-                 ('style' in first_string_parent.attrs) ):
-            continue
-
-        # For the style attribute, test that it contains the required font-family specification
-        style = first_string_parent.attrs['style']
-        regex = r"(?:^|;)" + r"font-family:" + font_family + r"(?:$|;)"
-        result = re.search(regex, style, re.M)
-        if result == None:
-            continue
-
-        # Test if the second string is all spaces ("&nbsp;"), within an enclosing span tag
-        second_string = paragraph_strings[1]
-        second_string_parent = second_string.parent
-        if not test_if_span_with_only_spaces(second_string_parent):
-            continue
-
-        # Test if the spaces' enclosing span tag is a child of the bullet-symbol's parent
-        if not (first_string_parent is second_string_parent.parent):
+        list_item = classify_unordered_list_item(paragraph)
+        if list_item == None:
             continue
+        html_entity_encodings_key, first_string, second_string = list_item
             
         '''
         Make needed fixes to the HTML
         '''
 
-        # Replace the bullet symbol, if needed, using the HTML defined in html_entity_encodings
-        if (html_entity_encodings[html_entity_encodings_key][FIX_KEY_ENCODE] != ""):
-            first_string.replace_with(
-                BeautifulSoup(html_entity_encodings[html_entity_encodings_key][FIX_KEY_ENCODE],
-                            'html.parser') )
-            symbol_replace_count += 1
+        # Replace the bullet symbol, if needed, using the text defined in html_entity_encodings
+        bullet_symbol_replacement = bullet_symbol_replacements[html_entity_encodings_key]
+        if (bullet_symbol_replacement != ""):
+            first_string.replace_with(NavigableString(bullet_symbol_replacement))
+            symbol_replace_count[html_entity_encodings_key] += 1
         
         # Replace the "&nbsp;"s, using the HTML defined in html_entity_encodings
         '''        
@@ -216,30 +417,61 @@ def fix_unordered_list_items(html_entity_encodings,
           * However, the number of "&nbsp;" entities is often incorrect, and it often results in
             a visibly misaligned unordered-list.
           * The problem is fixed by replacing the "&nbsp;"'s with six "&nbsp"'s.
+          * The six "&nbsp"'s are inserted as a string (SIX_NBSPS).
         '''
-        second_string.replace_with(BeautifulSoup(html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_ENCODE],
-                            'html.parser') )
+        second_string.replace_with(NavigableString(SIX_NBSPS))
         
         # The HTML paragraph has been fixed.  Its index in word_list_item_list is recorded.
         list_elements_to_remove.append(word_list_item_list_index)
-        bullets_fixed_count += 1
+        bullets_fixed_count[html_entity_encodings_key] += 1
 
     # * For the HTML paragraphs that have been fixed, remove them from the list
     #   word_list_item_list
     # * Removing them from the list does not remove them from the BeautifulSoup HTML
     #   (i.e., they are not removed from the BeautifulSoup object "soup")
-    for i in sorted(list_elements_to_remove, reverse=True):
-        del word_list_item_list[i]
-
-    print("INFO.  Editing the Word-HTML.  Fixing list-items with " +
-          html_entity_encodings[html_entity_encodings_key][FIX_KEY_DESCRIPTION] + 
-          "  Number of list-items found: " +  str(bullets_fixed_count) )
-    # Record stats for fixes
-    html_entity_encodings[html_entity_encodings_key][FIX_KEY_NUMBER_ENCODED] = symbol_replace_count
-    html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_NUMBER_ENCODED] += bullets_fixed_count
+    # * The list is rebuilt in one pass, rather than deleting each element.
+    #   * Each "del" shifts the elements after it, so deleting many elements is slow for long lists.
+    #   * The slice assignment "[:]" changes the caller's list.
+    list_elements_to_remove = set(list_elements_to_remove)
+    word_list_item_list[:] = [paragraph for i, paragraph in enumerate(word_list_item_list)
+                              if i not in list_elements_to_remove]
+
+    # Record stats for fixes, for each type of bullet-symbol
+    # * The caller displays the stats.
+    for html_entity_encodings_key in UNORDERED_LIST_BULLET_SYMBOLS.values():
+        html_entity_encodings[html_entity_encodings_key][FIX_KEY_NUMBER_ENCODED] = \
+            symbol_replace_count[html_entity_encodings_key]
+        html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_NUMBER_ENCODED] += \
+            bullets_fixed_count[html_entity_encodings_key]
+
+    return bullets_fixed_count
 # END OF: fix_unordered_list_items()
 
 
+def remove_color_white_from_style(style: str):
+    ''' 
+    Remove "color:white" from the input style-attribute value
+
+    Local function, called by: fix_word_html()
+
+    * Typically, "color:white" is the style's first or last property.
+      * For those cases, the string is sliced, rather than using the reg-ex.
+      * "color:white" must appear once in the style.  Otherwise, the reg-ex is used.
+    * The result is the same as using the reg-ex REGEX_COLOR_WHITE_SUBSTITUTION.
+
+    Returns:
+    * new_style : the style, with "color:white" removed
+    * substitution_count : the number of times "color:white" was removed
+    '''
+    if (style.count(STYLE_COLOR_WHITE) == 1):
+        if style.endswith(";" + STYLE_COLOR_WHITE):
+            return style[:-(len(STYLE_COLOR_WHITE) + 1)], 1
+        if style.startswith(STYLE_COLOR_WHITE + ";"):
+            return style[(len(STYLE_COLOR_WHITE) + 1):], 1
+    return REGEX_COLOR_WHITE_SUBSTITUTION.subn("", style)
+# END OF: remove_color_white_from_style()
+
+
 def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_warning_messages):
     ''' 
     Fix bugs in Word's HTML
@@ -255,7 +487,11 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
 
     Calls local functions:
     * fix_unordered_list_items()
+    * get_list_item_strings()
     * test_if_span_with_only_spaces()
+    * parse_style_attribute()
+    * serialize_style_attribute()
+    * remove_color_white_from_style()
 
     Return:
     * 1, None : error
@@ -294,7 +530,7 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     '''
     
     # * html_entity_encodings:
-    #   * Each entry specifies the HTML used to fix a particular bug in
+    #   * Each entry specifies the text used to fix a particular bug in
     #     the Word-HTML.
     #   * Each entry's value is itself a dictionary.  
     #     * The value is initialized to be a copy of HTML_ENTITY_ENCODING_SPECS.
@@ -308,28 +544,21 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     # Fix for solid-dot bullet-symbols
     html_entity_encodings[FIX_KEY_SOLID_DOT_BULLET][FIX_KEY_DESCRIPTION] = \
         "solid-dot bullet-symbols (used in levels 1,4,7)"
-    html_entity_encodings[FIX_KEY_SOLID_DOT_BULLET][FIX_KEY_ENCODE] = \
-        FIX_SCRIPT_OPENING_TAG + "&#9679;" + FIX_SCRIPT_CLOSING_TAG   
-    html_entity_encodings[FIX_KEY_SOLID_DOT_BULLET][FIX_KEY_DECODE] = "&#9679;"
+    html_entity_encodings[FIX_KEY_SOLID_DOT_BULLET][FIX_KEY_REPLACEMENT] = chr(9679)
 
     # Fix for solid-square bullet-symbols
     html_entity_encodings[FIX_KEY_SOLID_SQUARE_BULLET][FIX_KEY_DESCRIPTION] = \
         "solid-square bullet-symbols (used in levels 3,6,9)"
-    html_entity_encodings[FIX_KEY_SOLID_SQUARE_BULLET][FIX_KEY_ENCODE] = \
-        FIX_SCRIPT_OPENING_TAG + "&#9632;" + FIX_SCRIPT_CLOSING_TAG   
-    html_entity_encodings[FIX_KEY_SOLID_SQUARE_BULLET][FIX_KEY_DECODE] = "&#9632;"
+    html_entity_encodings[FIX_KEY_SOLID_SQUARE_BULLET][FIX_KEY_REPLACEMENT] = chr(9632)
 
     # For letter "o" bullet-symbols, specify no fix is needed for the bullet-symbol
     html_entity_encodings[FIX_KEY_LETTER_O_BULLET][FIX_KEY_DESCRIPTION] = \
         "letter \"o\" bullet-symbols (used in levels 2,5,8)"
-    html_entity_encodings[FIX_KEY_LETTER_O_BULLET][FIX_KEY_ENCODE] = ""   
-    html_entity_encodings[FIX_KEY_LETTER_O_BULLET][FIX_KEY_DECODE] = ""
+    html_entity_encodings[FIX_KEY_LETTER_O_BULLET][FIX_KEY_REPLACEMENT] = ""
 
     # Fix for spacing after a bullet-symbol (unordered list), or list-item symbol (ordered-list).
     html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_DESCRIPTION] = "list-item spacing"
-    html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_ENCODE] = \
-        FIX_SCRIPT_OPENING_TAG + "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;" + FIX_SCRIPT_CLOSING_TAG   
-    html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_DECODE] = "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;"
+    html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_REPLACEMENT] = SIX_NBSPS
 
 
     '''
@@ -351,7 +580,10 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
       * There are other ways that Word-HTML implements list-items.
         * They are described in the WWN development-documents, but their HTML is not edited by the system.
 
-    * body_inner_html.find_all() creates a Python list with the HTML paragraphs that have those distinctive features
+    * body_inner_html.select() creates a Python list with the HTML paragraphs that have a "text-indent" value.
+      * The list is then filtered, for the paragraphs with a known class name.
+      * The CSS selector's substring test, and a set look-up for the class names, replace
+        a reg-ex test of each paragraph's class and style.
       *  Each element in the Python list is an HTML paragraph, stored as a BeautifulSoup object
       *  That BeautifulSoup object is a pointer into the original BeautifulSoup object "soup"
       *  In creating the paragraph's BeautifulSoup object, the paragraph was not removed from "soup"
@@ -361,13 +593,15 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     # * A candidate list-item could be a Word list-item, but additional examination is needed to confirm.
     word_list_item_list = []
 
-    # "regex" is a reg-ex pattern used to match known class names, e.g., class=MsoNormal
+    # LIST_ITEM_CLASS_NAMES is a set of known class names, e.g., class=MsoNormal
     #  * These names have been observed in both ordered and unordered lists.
     #  * The only exception is the name "MsoListParagraph", which has only been observed in ordered lists.
-    regex = r'(^MsoListParagraph(CxSp(First|Middle|Last))?$)|(^MsoNormal$)|(^MsoBodyText$)'
-    word_list_item_list = body_inner_html.find_all('p', 
-        class_=re.compile(regex, re.M), 
-        attrs={'style': re.compile('text-indent:')})
+    #  * As with find_all(class_=...), a paragraph is selected if any of its class names is known.
+    for paragraph in body_inner_html.select(LIST_ITEM_STYLE_SELECTOR):
+        paragraph_classes = paragraph.get('class')
+        if ( (paragraph_classes != None) and 
+             any((class_name in LIST_ITEM_CLASS_NAMES) for class_name in paragraph_classes) ):
+            word_list_item_list.append(paragraph)
 
 
     '''
@@ -375,45 +609,17 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     Fix the list-items in unordered-lists
     ######################
     '''
-    '''
-    Encoding for symbols:
-    * Apparently, my editor changes the following symbols from 1-byte encoding to 2-byte encoding:
-      * Solid-dot bullet symbols, changed to "Â·"
-      * Solid-square bullet symbols, changed to ""Â§"
-    
-    * In both cases, the "Â" character was added.
-    * Perhaps the change was due to the editor using UTF-8 encoding.
-    * In the call to fix_unordered_list_items(), the 2-byte encoding for the symbol
-      does not match the intended symbol in the HTML file.
-
-    * So, in the calls to fix_unordered_list_items(), the ASCII value is specified for these symbols.
-      * For example:  symbol=chr(183),
-    '''
-
-    # Fix solid-dot bullet symbols, and their spacing
-    # * Word's solid-dot bullet is not displayed properly by Firefox.
-    #   * It is replaced here by the HTML solid-dot symbol "&#9679;"
-    fix_unordered_list_items(html_entity_encodings,
-                          word_list_item_list,
-                          font_family="Symbol",
-                          symbol=chr(183),
-                          html_entity_encodings_key=FIX_KEY_SOLID_DOT_BULLET)
-
-    # Fix solid-square bullet symbols, and their spacing
-    # * Word's solid-square bullet is not displayed properly by Firefox.
-    #   * It is replaced here by the HTML solid-square symbol "&#9632;"
-    fix_unordered_list_items(html_entity_encodings,
-                          word_list_item_list,
-                          font_family="Wingdings",
-                          symbol=chr(167),
-                          html_entity_encodings_key=FIX_KEY_SOLID_SQUARE_BULLET)
-
-    # Fix the spacing for the letter-"o" bullet symbols
-    fix_unordered_list_items(html_entity_encodings,
-                          word_list_item_list,
-                          font_family='"Courier New"',
-                          symbol="o",
-                          html_entity_encodings_key=FIX_KEY_LETTER_O_BULLET)
+    # Fix the bullet symbols, and their spacing
+    # * The bullet symbols are specified in UNORDERED_LIST_BULLET_SYMBOLS:
+    #   solid-dot, solid-square, and letter-"o"
+    # * The three types of bullet-symbols are fixed in one pass over word_list_item_list.
+    bullets_fixed_count = fix_unordered_list_items(html_entity_encodings, word_list_item_list)
+
+    # Display the stats for fixes, for each type of bullet-symbol, in one message
+    print("INFO.  Editing the Word-HTML.  Fixing unordered-list list-items.  Number of list-items found:\n" +
+          "\n".join("       * With " + html_entity_encodings[html_entity_encodings_key][FIX_KEY_DESCRIPTION] +
+                    ": " + str(bullets_fixed_count[html_entity_encodings_key])
+                    for html_entity_encodings_key in UNORDERED_LIST_BULLET_SYMBOLS.values()) )
 
     '''
     ######################
@@ -448,6 +654,9 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     unrecognized_indentation_units_list = []
     num_text_indent_unrecognized = 0
     num_list_items_fixed = 0
+    # The list-item spacing fix is used for each fixed list-item.
+    # * Its html_entity_encodings entry is looked-up once, before the loop.
+    six_nbsps_encoding = html_entity_encodings[FIX_KEY_SIX_NBSPS]
     # Loop for each HTML paragraph in word_list_item_list    
     for paragraph in word_list_item_list:
         '''
@@ -471,7 +680,8 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
         #   * These spaces are referred to as the "post-symbol spaces".
 
         # A list-item paragraph will have at least two strings
-        paragraph_strings = paragraph.find_all(string=True)
+        # * Only the paragraph's first three strings are used
+        paragraph_strings = get_list_item_strings(paragraph)
         if len(paragraph_strings) < 2:
             continue
 
@@ -503,8 +713,7 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
         # * This reg-ex matches the typical types of list-item symbols, and symbol formatting: 
         #   [1], 1), and 1.
         # * \S matches everything except whitespace, e.g., numbers, letters
-        regex = r'^[\[]?\S+[\)\.\]]$'
-        result = re.search(regex, text, re.M)
+        result = REGEX_LIST_ITEM_SYMBOL.search(text)
         if result == None:
             continue
 
@@ -523,9 +732,14 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
             continue
 
         # Test if the paragraph's text-indent value is in the expected form.
-        style = paragraph['style']
-        regex = r"(?:^|;)(text-indent:[+-]?[\.0-9]+)([a-zA-Z]+)(?:$|;)"
-        result = re.search(regex, style, re.M)
+        # * The style is parsed once, into a dictionary.
+        #   The candidate list-items were selected for having a style attribute.
+        # * The dictionary is used to test the text-indent value, and to fix it.
+        style_dict = parse_style_attribute(paragraph.get('style', ''))
+        text_indent = style_dict.get('text-indent')
+        if (text_indent == None):
+            continue
+        result = REGEX_TEXT_INDENT_VALUE.match(text_indent)
         if (result == None):
             continue
         # If the text-indent length-units are in not in inches, a warning message will be displayed, later.
@@ -534,15 +748,13 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
         #   * https://developer.mozilla.org/en-US/docs/Web/CSS/length
         elif (result.group(2) != 'in'):
             num_text_indent_unrecognized += 1
-            text_indent_specs = result.group(1) + result.group(2) 
+            text_indent_specs = "text-indent:" + result.group(1) + result.group(2) 
             unrecognized_indentation_units_list.append(text_indent_specs)
 
         # * Replace the post-symbol spaces with the correct number of spaces (&nbsp;)
-        # * The spaces are enclosed in a script tag, as was done in fixing unordered-lists.
-        ending_span_with_only_spaces.contents[0].replace_with(
-            BeautifulSoup(html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_ENCODE],
-                        'html.parser') )
-        html_entity_encodings[FIX_KEY_SIX_NBSPS][FIX_KEY_NUMBER_ENCODED] += 1
+        # * The spaces are inserted as a string, as was done in fixing unordered-lists.
+        ending_span_with_only_spaces.contents[0].replace_with(NavigableString(SIX_NBSPS))
+        six_nbsps_encoding[FIX_KEY_NUMBER_ENCODED] += 1
         
         # * Pre-symbol-spaces are within a span tag.
         # * If there are pre-symbol-spaces, delete the whole span tag.
@@ -552,17 +764,11 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
             first_string_parent.decompose()
 
         # Fix the paragraph's text-indent field by setting it to -.25
-        regex = r"((?:^|;)text-indent:)([+-]?[\.0-9]+[a-zA-Z]+)($|;)"
-        substitution = "\\1-.25in\\3"
-        new_style, substitution_count = re.subn(regex, substitution, style, 0, re.M)
-        if (substitution_count != 1):
-            print("")
-            print("ERROR.  Unexpected error, while fixing unordered-list list-items.")
-            print("        Regular-expression substitution failed, in setting text-indent to \"-.25in\"")
-            print("        List-item HTML:")
-            print(paragraph.decode(formatter='html'))
-            return 1, num_warning_messages
-        paragraph['style'] = new_style
+        # * The style attribute is serialized from the dictionary, once.
+        # * If the text-indent is already -.25in, the style attribute is not changed.
+        if (text_indent != "-.25in"):
+            style_dict['text-indent'] = "-.25in"
+            paragraph['style'] = serialize_style_attribute(style_dict)
 
         num_list_items_fixed += 1
 
@@ -599,52 +805,52 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     # * The input parameter-file has a key that's used to specify what types of Word-HTML are to be 
     #   fixed, for "color:white" 
     #   * The key's name is specified in the constant YML_KEY_WHITE_COLORED_TEXT
-    if ( (YML_KEY_WORD_HTML_EDITS in loaded_parms) and 
-         (YML_KEY_WHITE_COLORED_TEXT in loaded_parms[YML_KEY_WORD_HTML_EDITS]) ):
-        key_white_text_value = loaded_parms[YML_KEY_WORD_HTML_EDITS][YML_KEY_WHITE_COLORED_TEXT]
-    else:
-        # If the key isn't specified in the parameter-file, use the default value
-        key_white_text_value = YML_DO_NOT_REMOVE
+    #   * The key is in the parameter-file section YML_KEY_WORD_HTML_EDITS
+    # * If the section or the key isn't specified in the parameter-file, use the default value
+    word_html_edits = loaded_parms.get(YML_KEY_WORD_HTML_EDITS, {})
+    key_white_text_value = word_html_edits.get(YML_KEY_WHITE_COLORED_TEXT, YML_DO_NOT_REMOVE)
 
     print("INFO.  Processing the span tags with attribute \"style\" and value \"color:white\".  ") 
     print("       Processing-type used (specified via the parameter-file key \"white_colored_text\"): " + key_white_text_value)
 
     # * Get all of the span tags that have a style attribute, and the style attribute
     #   includes the value "color:white"
-    style_color_white = "color:white"
-    regex = r"(?:^|;)(?:" + style_color_white + ")(?:$|;)"
-    spans = body_inner_html.find_all('span', attrs={"style": re.compile(regex, re.M)})
+    # * This is done in two stages:
+    #   * A CSS selector gets the span tags whose style attribute contains the substring "color:white".
+    #     * The selector's substring test is cheaper than a reg-ex test for each span tag.
+    #     * The substring can also match other values, e.g., "color:whitesmoke".
+    #   * The reg-ex is then used to test the span tags that were selected.
+    # * The span tags are searched for with every processing-type, including YML_DO_NOT_REMOVE,
+    #   so they are counted and the warning below is displayed.
+    spans = [span for span in body_inner_html.select(COLOR_WHITE_SPAN_SELECTOR)
+             if REGEX_COLOR_WHITE.search(span['style']) != None]
 
     num_spans_under_paragraph = 0
     num_spans_not_under_paragraph = 0
     # Loop for each span tag
     for span in spans:
-        paragraph_ancestor_found = False
         # Determine if the span tag is within a paragraph
-        for span_parent in span.parents:
-            if span_parent.name == 'p':
-                paragraph_ancestor_found = True
-                break
-        
+        # * find_parent() searches the span tag's ancestors, and stops at the first paragraph
+        paragraph_ancestor_found = (span.find_parent('p') != None)
+    
         if paragraph_ancestor_found == True:
             num_spans_under_paragraph += 1
         else:
             num_spans_not_under_paragraph += 1
 
         # Remove "color:white" from the span tag's style attribute, as required
-        if ((key_white_text_value == YML_REMOVE_IN_PARAGRAPHS) and paragraph_ancestor_found) or \
-            (key_white_text_value == YML_REMOVE_ALL):
+        # * For YML_DO_NOT_REMOVE, the span tags are only counted, and not edited
+        if (key_white_text_value == YML_REMOVE_ALL) or \
+           ((key_white_text_value == YML_REMOVE_IN_PARAGRAPHS) and paragraph_ancestor_found):
             style = span['style']
             # If the style-attribute's only value is "color:white", delete the style attribute
-            if (style == style_color_white):
+            if (style == STYLE_COLOR_WHITE):
                 del span['style']
             else:
-                regex = r"((?:^|;)(?:" + style_color_white + ")(?:$|;))"
-                substitution = ""
-                new_style, substitution_count = re.subn(regex, substitution, style, 0, re.M)
+                new_style, substitution_count = remove_color_white_from_style(style)
                 if (substitution_count != 1):
                     print("")
-                    print("ERROR.  Editing HTML span tags within a paragraph, having span attribute \"style\" and value \"color:white\".")
+                    print("ERROR.  Editing HTML span tags, having span attribute \"style\" and value \"color:white\".")
                     print("        For a span-tag, the regular-expression substitution failed in removing \"color:white\".")
                     print("        span-tag HTML:")
                     print("")
@@ -674,36 +880,14 @@ def fix_word_html(loaded_parms, jinja_template_variables, body_inner_html, num_w
     Generate the HTML, from BeautifulSoup format, into text format
     '''
     # generated_html is a string variable
-    generated_html = body_inner_html.decode(formatter='html')
-
-    '''
-    * If any HTML fixes are within a script tag, the script opening-tag and closing-tag 
-      is removed from the HTML text
-    '''
-    # * When the HTML was edited, if HTML entities were added (e.g., &nbsp;), they were put inside of
-    #   a script tag.  This prevented BeautifulSoup from altering the HTML entities.
-    # * The script opening-tags and closing-tags are removed, using reg-ex substitution.
-    # * html_entity_encodings was described earlier.
-    
-    # Loop for each entry in html_entity_encodings
-    for key in html_entity_encodings:
-        # Test if new HTML was added for this HTML-fix
-        if html_entity_encodings[key][FIX_KEY_NUMBER_ENCODED] != 0:
-            # The new-HTML is specified by the entry FIX_KEY_ENCODE.  
-            # * This HTML includes the script opening-tag and closing-tag
-            regex = html_entity_encodings[key][FIX_KEY_ENCODE]
-            # * The new-HTML, without the script opening-tag and closing-tag, is specified by the 
-            #   entry FIX_KEY_DECODE 
-            substitution = html_entity_encodings[key][FIX_KEY_DECODE]
-            # Use a reg-ex to replace the new-HTML, and remove the script opening-tag and closing-tag.
-            generated_html, substitution_count = re.subn(regex, substitution, generated_html, 0)
-            if substitution_count != html_entity_encodings[key][FIX_KEY_NUMBER_ENCODED]:
-                print("")
-                print("ERROR.  Decoding the " + html_entity_encodings[key][FIX_KEY_DESCRIPTION] +
-                    ".  Number decoded (%s) is not equal to the number encoded (%s)."  
-                    % (substitution_count, html_entity_encodings[key][FIX_KEY_NUMBER_ENCODED]))
-                return 1, num_warning_messages
-            print("INFO.  Decoding the " + html_entity_encodings[key][FIX_KEY_DESCRIPTION])
+    # * The "minimal" formatter only escapes the characters &, < and >.
+    #   * The "html" formatter also converts characters to named HTML entities, e.g., "\xa0" to "&nbsp;".
+    #     That conversion is a substitution-pass over the whole document-text, and it is not needed:
+    #     * The output HTML-file is written with UTF-8 encoding, and BeautifulSoup sets the charset
+    #       in the Word-HTML's <meta> tag to "utf-8".  So, the characters display the same.
+    #     * The fixes added characters, rather than HTML entities, e.g., chr(9679) rather than "&#9679;".
+    #       So, the HTML text is not edited further to restore HTML entities.
+    generated_html = body_inner_html.decode(formatter='minimal')
 
     # * generated_html has the document-text's HTML, with the fixes applied.
     # * Later, Jinja will be used to put generated_html in the output HTML
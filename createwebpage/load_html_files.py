@@ -1,8 +1,10 @@
 '''
 ################
-This file contains the function: load_html_files()
+This file contains the functions: load_html_files(), load_jinja_template()
 
-The function is called by: create_web_page_core() in create_web_page.py
+load_html_files() is called by: create_web_page_core() in create_web_page.py
+load_jinja_template() is called by: load_html_files(), and init_worker() in 
+  tools/create_web_page_for_all_yml_files.py
 
 MIT License, Copyright (c) 2021-present Jim Yuill
 ################
@@ -11,6 +13,7 @@ MIT License, Copyright (c) 2021-present Jim Yuill
 import re
 import sys
 import os
+import pathlib
 # Specifies the YAML keys for the input parameter-file
 from input_parameter_file_keys import *
 
@@ -20,9 +23,9 @@ try:
     HTML-related libraries
     '''
     # BeautifulSoup:  pip install beautifulsoup4
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, FeatureNotFound
     # Jinja2:  pip install jinja2
-    from jinja2 import Template
+    from jinja2 import Environment
 except ImportError as e:
     print("")
     print("ERROR.  Could not import a required Python module.")
@@ -33,6 +36,90 @@ except ImportError as e:
     print("")    
     sys.exit()
 
+# The parser used by BeautifulSoup to load the input Word-HTML-file
+# * lxml is optional.  If it is installed, it is used, as it parses large files faster.
+#   * lxml:  pip install lxml
+# * Otherwise, Python's built-in parser is used.
+#   * It is also used if BeautifulSoup can't use lxml (FeatureNotFound), e.g., an incompatible version.
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# The path to WWN's jinja template-file
+# * It's in the same directory as the present file.
+# * The path is determined once, when the module is loaded.
+SCRIPTS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+JINJA_TEMPLATE_FILE_NAME = "jinja_template.html"
+JINJA_TEMPLATE_FILE_PATH = os.path.join(SCRIPTS_DIRECTORY, JINJA_TEMPLATE_FILE_NAME)
+
+# The Jinja environment used to compile WWN's jinja template-file
+# * It uses Jinja's defaults, as jinja2.Template() does.
+JINJA_ENVIRONMENT = Environment()
+
+# WWN's jinja template, as a compiled Jinja-template object
+# * It's set by load_jinja_template(), the first time the template is loaded.
+# * When many documents are processed by one Python process, the template-file is read, 
+#   verified and compiled once.
+JINJA_TEMPLATE = None
+
+"""
+##################
+* Global constants, the reg-ex patterns used in verifying the input files' signatures
+* The patterns are compiled once, when the module is loaded.
+##################
+"""
+
+# Matches the jinja template-file's signature
+# * Regex pattern tested and explained:  https://regex101.com/r/EZTpUo/2/
+REGEX_JINJA_TEMPLATE_SIGNATURE = re.compile(
+    r"<meta\s+name=Generator\s+content=\"WordWebNav, version {{version}}\">", (re.M | re.S))
+# Matches the MS-Word signature, in the content of the Word-HTML's Generator <meta> tag
+REGEX_MS_WORD_SIGNATURE = re.compile(r"^Microsoft Word [0-9]+ \(filtered\)$", re.M)
+
+
+def load_jinja_template():
+    '''
+    Description:
+    * Reads WWN's jinja template-file, verifies its signature, and compiles it
+    * The compiled template is saved in JINJA_TEMPLATE
+      * The signature is verified on the same text that's compiled.  So, the template used 
+        is the one that was verified.
+
+    Return:
+    * 0 : Success
+    * 1 : Error.  An error message was printed.
+    ################
+    '''
+    global JINJA_TEMPLATE
+
+    # * The file is read in one call, which also closes the file.
+    # * The encoding is specified, rather than using the platform's default encoding.
+    try:
+        jinja_template_file_data = pathlib.Path(JINJA_TEMPLATE_FILE_PATH).read_text(encoding="utf-8")
+    except IOError as e:
+        print("")
+        print("ERROR.  Could not open the expected jinja template-file.")
+        print("        %s - %s." % (e.strerror, e.filename))
+        return 1
+
+    # Verify the jinja tempate-file has the expected signature:
+    # * The reg-ex is REGEX_JINJA_TEMPLATE_SIGNATURE
+    jinja_template_file_signature = "<meta name=Generator content=\"WordWebNav, version {{version}}\">"
+    search_result = REGEX_JINJA_TEMPLATE_SIGNATURE.search(jinja_template_file_data)
+    if search_result == None:
+        print("")
+        print("ERROR.  The jinja template-file does not have the expected signature:")
+        print("        " + jinja_template_file_signature)
+        return 1
+
+    # Compile the jinja template-file's text, as a Jinja-template object
+    JINJA_TEMPLATE = JINJA_ENVIRONMENT.from_string(jinja_template_file_data)
+    return 0
+
+# END OF: load_jinja_template()
+
 
 def load_html_files(loaded_parms):
     '''
@@ -48,47 +135,22 @@ def load_html_files(loaded_parms):
     ################
     '''
 
-    # Name of WWN's jinja-template file
-    # * It's in the same directory as the present file.
-    JINJA_TEMPLATE_FILE_NAME = "jinja_template.html"
-
     ###################
     # Open the jinja template-file, and use Jinja2 to create a jinja-template object
     ###################
  
-    # Get the path to the WWN jinja template-file.
-    scripts_directory = os.path.dirname(os.path.realpath(__file__))
-    jinja_template_file_path = os.path.join(scripts_directory, JINJA_TEMPLATE_FILE_NAME)
+    # The path to the WWN jinja template-file was determined when the module was loaded.
+    jinja_template_file_path = JINJA_TEMPLATE_FILE_PATH
 
     print("INFO.  Opening the jinja template-file, and loading it:")
     print("       " + jinja_template_file_path)
-    try:
-        jinja_template_file_handle = open(jinja_template_file_path)
-    except IOError as e:
-        print("")
-        print("ERROR.  Could not open the expected jinja template-file.")
-        print("        %s - %s." % (e.strerror, e.filename))
-        return 1, None
-  
-    jinja_template_file_data = jinja_template_file_handle.read()
-    jinja_template_file_handle.close()
-
-    # Verify the jinja tempate-file has the expected signature:
-    # Regex pattern tested and explained:  https://regex101.com/r/EZTpUo/2/
-    jinja_template_file_signature = "<meta name=Generator content=\"WordWebNav, version {{version}}\">"
-    regex = r"<meta\s+name=Generator\s+content=\"WordWebNav, version {{version}}\">"
-    search_result = re.search(regex, jinja_template_file_data, (re.M | re.S))
-    if search_result == None:
-        print("")
-        print("ERROR.  The jinja template-file does not have the expected signature:")
-        print("        " + jinja_template_file_signature)
-        return 1, None
-
-    # Load the jinja template-file, as a Jinja-template object
-    # * This load technique will break if there is template inheritance, but it's not used here.
-    # * There are techniques that don't break, but they are more complicated.
+    # * The template is loaded the first time it's used, and then it's reused from JINJA_TEMPLATE.
     # * https://stackoverflow.com/questions/38642557/how-to-load-jinja-template-directly-from-filesystem
-    jinja_template = Template(jinja_template_file_data)
+    if (JINJA_TEMPLATE == None):
+        return_value = load_jinja_template()
+        if (return_value == 1):
+            return 1, None
+    jinja_template = JINJA_TEMPLATE
 
 
     ####################
@@ -98,8 +160,11 @@ def load_html_files(loaded_parms):
     input_html_path_value = loaded_parms[YML_KEY_REQUIRED][YML_KEY_INPUT_HTML_PATH]
     print("INFO.  Opening the input Word-HTML-file:")
     print("       " + input_html_path_value)
+    # * The file is opened in binary mode.  BeautifulSoup determines the file's encoding,
+    #   e.g., from the charset in Word's <meta> tag, and decodes the file once.
+    #   * In text mode, Python would first decode the file using the platform's default encoding.
     try:
-        input_html_handle = open(input_html_path_value)
+        input_html_handle = open(input_html_path_value, 'rb')
     except IOError as e:
         print("")
         print("ERROR.  Could not open the input Word-HTML-file.")
@@ -108,8 +173,14 @@ def load_html_files(loaded_parms):
 
     # * BeautifulSoup may fail to load the HTML due to the HTML using an
     #   unrecognized encoding.
+    # * HTML_PARSER specifies the parser, as described above.
+    #   * BeautifulSoup looks-up the parser before it reads the file.  So, if the parser
+    #     is not found, the file can be read using Python's built-in parser.
     try:
-        soup = BeautifulSoup(input_html_handle, 'html.parser')
+        try:
+            soup = BeautifulSoup(input_html_handle, HTML_PARSER)
+        except FeatureNotFound:
+            soup = BeautifulSoup(input_html_handle, 'html.parser')
     except Exception as error:
         print("")
         print("ERROR.  Could not load the input Word HTML-file.")
@@ -126,8 +197,11 @@ def load_html_files(loaded_parms):
     # * Also, get the HTML head and body sections, as BeautifulSoup objects
     ##########################
 
+    # * The find_all() searches stop after two elements are found.
+    #   Two are enough to test for exactly one.
+
     # Veryify that the HTML has excatly one <head> element
-    heads = soup.find_all('head')
+    heads = soup.find_all('head', limit=2)
     if len(heads) != 1:
         print("")
         print("ERROR.  The input Word-HTML does not have exactly one <head> element.")
@@ -135,7 +209,7 @@ def load_html_files(loaded_parms):
     head = heads[0]
 
     # There should be exactly one <body> element
-    bodys = soup.find_all('body')
+    bodys = soup.find_all('body', limit=2)
     if len(bodys) != 1:
         print("")
         print("ERROR.  The input Word-HTML does not have exactly one <body> element.")
@@ -145,14 +219,14 @@ def load_html_files(loaded_parms):
     # Check for expected <div> sections
     # * There can be multiple <div> sections
     # * If there are none, it's just reported as an INFO message
-    divs = soup.find_all('div')
-    if len(divs) == 0:
-        print("")
-        print("INFO.  The input Word-HTML does not have <div> sections. ")
-    else:
-        # Check for expected <div> section
-        div = soup.find('div', class_="WordSection1")
-        if (div == None):
+    # * The expected <div> section is searched for first.  
+    #   * Typically, it is found, and the other <div> sections are not searched for.
+    div = soup.find('div', class_="WordSection1")
+    if (div == None):
+        if (soup.find('div') == None):
+            print("")
+            print("INFO.  The input Word-HTML does not have <div> sections. ")
+        else:
             print("INFO.  The input Word-HTML does not have the div section: " +
                   "<div class=WordSection1>")
 
@@ -164,10 +238,12 @@ def load_html_files(loaded_parms):
     meta_found = soup.head.find('meta', attrs={'name': 'Generator'})
     if (meta_found != None) and ('content' in meta_found.attrs):
         meta_content = meta_found['content']
-        regex = r"^Microsoft Word [0-9]+ \(filtered\)$"
-        search_result = re.search(regex, meta_content, re.M)
-        if search_result != None:
-            signature_found = True
+        # * Substring tests quickly reject content that can't match the reg-ex.
+        # * The reg-ex then verifies the signature.
+        if ("Microsoft Word " in meta_content) and (" (filtered)" in meta_content):
+            search_result = REGEX_MS_WORD_SIGNATURE.search(meta_content)
+            if search_result != None:
+                signature_found = True
 
     if signature_found == False:
         print("")
@@ -10,6 +10,7 @@ MIT License, Copyright (c) 2021-present Jim Yuill
 
 import sys 
 import os
+import itertools
 # Specifies the YAML keys for the input parameter-file
 from input_parameter_file_keys import *
 
@@ -21,7 +22,7 @@ try:
     # Cerberus:  pip install cerberus
     from cerberus import Validator
     # pprint++:  pip install pprintpp
-    import pprintpp 
+    # * pprint++ is imported when it's first needed, by print_cerberus_errors()
     # PyYAML:  pip install PyYAML
     import yaml
     # yamllint:  pip install yamllint
@@ -37,319 +38,407 @@ except ImportError as e:
     print("")    
     sys.exit()
 
-def load_input_parameter_file(parameter_file_path : str):
-    '''
-    Description:
-    * Loads the WWN input parameter-file, and verifies it
-    
-    Operation:
-    * Verifies the input parameter-file's syntax
-    * yamllint is used to verify the parameter-file's YAML syntax. 
-    * PyYAML's YAML-loader is used to load the parameter-file into a Python
-      object, made-up of dictionaries and lists.
-    * Cerberus is used to verify the parameter-file's syntax, using a schema.
-    * Verifies the WordWebNav version that is specified in the parameter-file
-    * The syntax verification is further described in the WWN development-documents.
-      The documents are:
-      * In the repo, under /docs/development-docs
-      * On the WWN web-site
-
-    Parameter: parameter_file_path, specifies the input parameter-file's path
+# The PyYAML loader used to load the parameter-file
+# * The parameter-file just has dictionaries, lists and strings, so a "safe" loader is sufficient.
+# * PyYAML's C-based loader (CSafeLoader) is faster.  It's used if PyYAML was installed with LibYAML.
+#   Otherwise, the Python-based loader (SafeLoader) is used.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+"""
+##################
+* Global constants
+* The constants are created once, when the module is loaded.
+##################
+"""
+
+# Name for the yamllint config-file
+YAMLLINT_CONFIG_FILE_NAME = "yamllint_config_file.yml"
+# The yamllint configuration, loaded from the yamllint config-file
+# * It is loaded when load_input_parameter_file() is first called, and then reused.
+YAMLLINT_CONFIGURATION = None
+# Maximum number of yamllint errors that are reported
+# * yamllint stops checking the parameter-file once this many errors are found.
+MAX_YAMLLINT_ERRORS = 20
+# Specifies if yamllint is used to verify the parameter-file's YAML syntax
+# * yamllint is a pure-Python linter, and it's the slowest step in verifying the parameter-file.
+#   Without it, the parameter-file is still verified by PyYAML's YAML-loader and by Cerberus.
+# * The default is True, so yamllint is used.  Only batch_create_web_page.py overrides it:
+#   it sets STRICT_YAML_LINT to False, unless its --strict option is used.
+STRICT_YAML_LINT = True
+# Number of lines at the start of the parameter-file that are checked for the WordWebNav version
+# * The "required" section, with the "version" key, is normally at the start of the file.
+#   In the parameter-file templates, it follows a block of comments of about 20 lines.
+PARAMETER_FILE_HEADER_LINES = 40
+# The pprint++ pretty-printer, used to print Cerberus errors
+# * It is created by print_cerberus_errors() when it's first needed, and then reused.
+PRETTY_PRINTER = None
 
-    Return
-    * 1, None : Error
-    * 0, loaded_parms : loaded_parms is a dictionary with the input parameter-file's
-                        contents
-    '''    
-
-    '''
-    ##################
-    Constants
-    ##################
-    '''
-    # Name for the yamllint config-file
-    YAMLLINT_CONFIG_FILE_NAME = "yamllint_config_file.yml"
-
-    '''
-    # The following are Cerberus schema-definitons, for the input parameter-file.
-      * The parameter-file is in YAML formt.
-      * The parameter-file is validated by calling Cerberus.
-      * These schema-definitions are used by Cerberus, to validate the parameter-file.
-
-      * These schema-definitons specify the parameter-file's structure, keys, and values.
-      * The parameter-file is described in the system documentation.
-      * These schema-definitons specify the parameter-file syntax that is described in the 
-        system documentation.
-      * Since Cerberus is used to validate the parameter-file, the WWN code that processes the parameter-file
-        assumes the parameter-file has valid syntax, e.g., it assumes that required keys are present.
-    '''
+'''
+# The following are Cerberus schema-definitons, for the input parameter-file.
+  * The parameter-file is in YAML formt.
+  * The parameter-file is validated by calling Cerberus.
+  * These schema-definitions are used by Cerberus, to validate the parameter-file.
+
+  * These schema-definitons specify the parameter-file's structure, keys, and values.
+  * The parameter-file is described in the system documentation.
+  * These schema-definitons specify the parameter-file syntax that is described in the 
+    system documentation.
+  * Since Cerberus is used to validate the parameter-file, the WWN code that processes the parameter-file
+    assumes the parameter-file has valid syntax, e.g., it assumes that required keys are present.
+'''
 
-    # The Cerberus schema-definition
-    PARAMETER_FILE_SCHEMA = {
-
-        # Parameter-file section. Name: "required":
-        # Example contents for the section:
-        #
-        #   required:
-        #     version: "1.0"
-        #     input_html_path: D:\Documents\Professional-projects\My-web-site-development\Word-to-HTML\automation-dev\testing\test-Word-files\test-Word-files\tests-for-create_web_page_py\WordWebNav--Word-HTML\all-primary-Word-features.html
-        #     output_directory_path: D:\Documents\Professional-projects\My-web-site-development\Word-to-HTML\automation-dev\testing\test-Word-files\test-Word-files\tests-for-create_web_page_py\WordWebNav--HTML
-        #     scripts_directory_url: D:\Documents\Professional-projects\My-web-site-development\Word-to-HTML\WordWebNav\word_web_nav\assets
-        #
-        YML_KEY_REQUIRED: {
-            "type": "dict",
-            "required": True,
-            "schema": {
-                YML_KEY_VERSION: {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1
-                },
-                YML_KEY_INPUT_HTML_PATH: {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1                
-                },
-                YML_KEY_OUTPUT_DIRECTORY_PATH: {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1                
-                },
-                YML_KEY_SCRIPTS_DIRECTORY_URL: {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1                
-                }
+# The Cerberus schema-definition
+# * The schema is read-only.  It's built once, and it's shared by CERBERUS_VALIDATOR
+#   for all parameter-files, so it must not be modified.
+# * The schema's dictionaries are plain dicts.  Read-only mappings (e.g., types.MappingProxyType)
+#   can't be used, because Cerberus copies parts of the schema when it validates a document.
+PARAMETER_FILE_SCHEMA = {
+
+    # Parameter-file section. Name: "required":
+    # Example contents for the section:
+    #
+    #   required:
+    #     version: "1.0"
+    #     input_html_path: D:\Documents\Professional-projects\My-web-site-development\Word-to-HTML\automation-dev\testing\test-Word-files\test-Word-files\tests-for-create_web_page_py\WordWebNav--Word-HTML\all-primary-Word-features.html
+    #     output_directory_path: D:\Documents\Professional-projects\My-web-site-development\Word-to-HTML\automation-dev\testing\test-Word-files\test-Word-files\tests-for-create_web_page_py\WordWebNav--HTML
+    #     scripts_directory_url: D:\Documents\Professional-projects\My-web-site-development\Word-to-HTML\WordWebNav\word_web_nav\assets
+    #
+    YML_KEY_REQUIRED: {
+        "type": "dict",
+        "required": True,
+        "schema": {
+            YML_KEY_VERSION: {
+                "type": "string",
+                "required": True,
+                "minlength": 1
+            },
+            YML_KEY_INPUT_HTML_PATH: {
+                "type": "string",
+                "required": True,
+                "minlength": 1                
+            },
+            YML_KEY_OUTPUT_DIRECTORY_PATH: {
+                "type": "string",
+                "required": True,
+                "minlength": 1                
+            },
+            YML_KEY_SCRIPTS_DIRECTORY_URL: {
+                "type": "string",
+                "required": True,
+                "minlength": 1                
             }
-        },
-
-        # Parameter-file section. Name: "html_head_section":
-        # Example contents for the section:
-        #
-        #   html_head_section:
-        #     title: Sys-Admin How-To Info
-        #     description: Solutions for my various sys-admin tasks
-        #     additional_html: <link rel="icon" type="image/png" href="/favicon-32x32.png" sizes="32x32" />
-        #
-        YML_KEY_HTML_HEAD_SECTION: {
-            "type": "dict",
-            "required": False,
-            "schema": {
-                YML_KEY_TITLE: {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1                
-                },
-                YML_KEY_DESCRIPTION: {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1                
-                },
-                YML_KEY_ADDITIONAL_HTML: {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1                
-                }
+        }
+    },
+
+    # Parameter-file section. Name: "html_head_section":
+    # Example contents for the section:
+    #
+    #   html_head_section:
+    #     title: Sys-Admin How-To Info
+    #     description: Solutions for my various sys-admin tasks
+    #     additional_html: <link rel="icon" type="image/png" href="/favicon-32x32.png" sizes="32x32" />
+    #
+    YML_KEY_HTML_HEAD_SECTION: {
+        "type": "dict",
+        "required": False,
+        "schema": {
+            YML_KEY_TITLE: {
+                "type": "string",
+                "required": False,
+                "minlength": 1                
+            },
+            YML_KEY_DESCRIPTION: {
+                "type": "string",
+                "required": False,
+                "minlength": 1                
+            },
+            YML_KEY_ADDITIONAL_HTML: {
+                "type": "string",
+                "required": False,
+                "minlength": 1                
             }
-        },
-
-        # Parameter-file section. Name: "header_bar":
-        # Example contents for the section:
-        #
-        #  header_bar:
-        #    # One or more sections
-        #    - section:
-        #        contents:
-        #          # Exactly one of the following keys:
-        #          breadcrumbs:
-        #            # One or more hyperlinks 
-        #            - hyperlink:
-        #                text: Home
-        #                url: http://jimyuill.com
-        #          text:
-        #          html:
-        #          empty:
-        #        contents_alignment:
-        #
-        YML_KEY_HEADER_BAR: {
-            "type": "list",
-            "required": False,
+        }
+    },
+
+    # Parameter-file section. Name: "header_bar":
+    # Example contents for the section:
+    #
+    #  header_bar:
+    #    # One or more sections
+    #    - section:
+    #        contents:
+    #          # Exactly one of the following keys:
+    #          breadcrumbs:
+    #            # One or more hyperlinks 
+    #            - hyperlink:
+    #                text: Home
+    #                url: http://jimyuill.com
+    #          text:
+    #          html:
+    #          empty:
+    #        contents_alignment:
+    #
+    YML_KEY_HEADER_BAR: {
+        "type": "list",
+        "required": False,
+        "schema": {
+            "type": "dict",
             "schema": {
-                "type": "dict",
-                "schema": {
-                    YML_KEY_SECTION: {
-                        "type": "dict",
-                        "schema": {
-                            YML_KEY_CONTENTS: {
-                                "type": "dict",
-                                "required": True,
-                                # Only one entry allowed in dict
-                                "maxlength" : 1, 
-                                "schema" : {
-                                    YML_KEY_BREADCRUMBS: {
-                                        # * This entry is a list, and 
-                                        #   each list-member specifies a hyperlink
-                                        "type": "list",
-                                        "required": False,
+                YML_KEY_SECTION: {
+                    "type": "dict",
+                    "schema": {
+                        YML_KEY_CONTENTS: {
+                            "type": "dict",
+                            "required": True,
+                            # Only one entry allowed in dict
+                            "maxlength" : 1, 
+                            "schema" : {
+                                YML_KEY_BREADCRUMBS: {
+                                    # * This entry is a list, and 
+                                    #   each list-member specifies a hyperlink
+                                    "type": "list",
+                                    "required": False,
+                                    "schema": {
+                                        "type": "dict",
                                         "schema": {
-                                            "type": "dict",
-                                            "schema": {
-                                                YML_KEY_HYPERLINK : {
-                                                    "type": "dict",
-                                                    "schema": {
-                                                        YML_KEY_TEXT: {
-                                                            "type": "string",
-                                                            "required": True,
-                                                            "minlength": 1
-                                                        },
-                                                        YML_KEY_URL: {
-                                                            "type": "string",
-                                                            "required": True,
-                                                            "minlength": 1                            
-                                                        }
+                                            YML_KEY_HYPERLINK : {
+                                                "type": "dict",
+                                                "schema": {
+                                                    YML_KEY_TEXT: {
+                                                        "type": "string",
+                                                        "required": True,
+                                                        "minlength": 1
+                                                    },
+                                                    YML_KEY_URL: {
+                                                        "type": "string",
+                                                        "required": True,
+                                                        "minlength": 1                            
                                                     }
                                                 }
                                             }
                                         }
-                                    },
-
-                                    YML_KEY_HYPERLINK : {
-                                        "type": "dict",
-                                        "required": False,
-                                        "schema": {
-                                            YML_KEY_TEXT: {
-                                                "type": "string",
-                                                "required": True,
-                                                "minlength": 1            
-                                            },
-                                            YML_KEY_URL: {
-                                                "type": "string",
-                                                "required": True,
-                                                "minlength": 1            
-                                            }
+                                    }
+                                },
+
+                                YML_KEY_HYPERLINK : {
+                                    "type": "dict",
+                                    "required": False,
+                                    "schema": {
+                                        YML_KEY_TEXT: {
+                                            "type": "string",
+                                            "required": True,
+                                            "minlength": 1            
+                                        },
+                                        YML_KEY_URL: {
+                                            "type": "string",
+                                            "required": True,
+                                            "minlength": 1            
                                         }
-                                    },
-
-                                    YML_KEY_TEXT : {
-                                        "type": "string",
-                                        "required": False,
-                                        "minlength": 1
-                                    },
-
-                                    YML_KEY_HTML : {
-                                        "type": "string",
-                                        "required": False,
-                                        "minlength": 1
-                                    },
-
-                                    YML_KEY_EMPTY : {
-                                        "type": "string",
-                                        "required": False,
-                                        "maxlength" : 0,   # Ensures no value is specified
-                                        "nullable": True   # Allows key to have no value
                                     }
+                                },
+
+                                YML_KEY_TEXT : {
+                                    "type": "string",
+                                    "required": False,
+                                    "minlength": 1
+                                },
+
+                                YML_KEY_HTML : {
+                                    "type": "string",
+                                    "required": False,
+                                    "minlength": 1
+                                },
+
+                                YML_KEY_EMPTY : {
+                                    "type": "string",
+                                    "required": False,
+                                    "maxlength" : 0,   # Ensures no value is specified
+                                    "nullable": True   # Allows key to have no value
                                 }
-                            },
-
-                            YML_KEY_CONTENTS_ALIGNMENT: {
-                                "type": "string",
-                                "required": False,
-                                "allowed": ["left", "right", "center", "justify"]
                             }
+                        },
+
+                        YML_KEY_CONTENTS_ALIGNMENT: {
+                            "type": "string",
+                            "required": False,
+                            "allowed": ["left", "right", "center", "justify"]
                         }
                     }
                 }
             }
-        },
-
-        # Parameter-file section. Name: "document_text_trailer":
-        # Example contents for the section:
-        #
-        #   document_text_trailer: |
-        #     <div id="commento"></div>
-        #     <script defer
-        #       src="https://cdn.commento.io/js/commento.js">
-        #     </script>
-        #
-        YML_KEY_DOCUMENT_TEXT_TRAILER: {
-            "type": "string",
-            "required": False,
-            "minlength" : 1
-        },
-
-        # Parameter-file section. Name: "word_html_edits":
-        # Example contents for the section:
-        #
-        #   word_html_edits:
-        #     white_colored_text: removeAll
-        #
-        YML_KEY_WORD_HTML_EDITS: {
-            "type": "dict",
-            "required": False,
-            "schema": {
-                YML_KEY_WHITE_COLORED_TEXT: {
-                    "type": "string",
-                    "required": False,
-                    "allowed": [YML_DO_NOT_REMOVE, YML_REMOVE_IN_PARAGRAPHS, YML_REMOVE_ALL]
-                }
+        }
+    },
+
+    # Parameter-file section. Name: "document_text_trailer":
+    # Example contents for the section:
+    #
+    #   document_text_trailer: |
+    #     <div id="commento"></div>
+    #     <script defer
+    #       src="https://cdn.commento.io/js/commento.js">
+    #     </script>
+    #
+    YML_KEY_DOCUMENT_TEXT_TRAILER: {
+        "type": "string",
+        "required": False,
+        "minlength" : 1
+    },
+
+    # Parameter-file section. Name: "word_html_edits":
+    # Example contents for the section:
+    #
+    #   word_html_edits:
+    #     white_colored_text: removeAll
+    #
+    YML_KEY_WORD_HTML_EDITS: {
+        "type": "dict",
+        "required": False,
+        "schema": {
+            YML_KEY_WHITE_COLORED_TEXT: {
+                "type": "string",
+                "required": False,
+                "allowed": [YML_DO_NOT_REMOVE, YML_REMOVE_IN_PARAGRAPHS, YML_REMOVE_ALL]
             }
         }
     }
-    # END of: PARAMETER_FILE_SCHEMA = {
+}
+# END of: PARAMETER_FILE_SCHEMA = {
+
+# The Cerberus Validator, bound to the schema
+# * It is created once, so Cerberus processes the schema once, rather than for each parameter-file.
+# * A Validator instance is not thread-safe.  Each process gets its own instance, when the module is loaded.
+CERBERUS_VALIDATOR = Validator(PARAMETER_FILE_SCHEMA)
 
 
+def get_version_from_header(parameter_file_text):
     '''
-    ##################
-    Function body
-    ##################
+    Description:
+    * Gets the WordWebNav version from the start of the parameter-file, i.e., 
+      from the first PARAMETER_FILE_HEADER_LINES lines.
+    * This is a quick check, done before the parameter-file is fully verified.
+      It lets a parameter-file with the wrong version be rejected without running
+      yamllint and Cerberus.
+
+    Parameter: parameter_file_text, the parameter-file's contents
+
+    Return
+    * The version string, if it's found in the start of the parameter-file
+    * None : the version was not found, e.g., the start of the file could not be loaded
     '''
-    
-    # Open the input parameter-file
-    print("INFO.  Processing the parameter-file:")
-    print("       " + parameter_file_path)
+    header_text = "\n".join(parameter_file_text.split("\n", PARAMETER_FILE_HEADER_LINES)[:PARAMETER_FILE_HEADER_LINES])
+    # The header may end part-way through a YAML structure, so loading errors are ignored
     try:
-        parameter_file_handle = open(parameter_file_path)
-    except IOError as e:
-        print("")
-        print("ERROR.  Could not open the parameter-file.")
-        print("        %s - %s." % (e.strerror, e.filename))
-        print("")        
-        return 1, None
+        loaded_header = yaml.load(header_text, Loader=YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(loaded_header, dict):
+        return None
+    required_section = loaded_header.get(YML_KEY_REQUIRED)
+    if not isinstance(required_section, dict):
+        return None
+    key_version_value = required_section.get(YML_KEY_VERSION)
+    if not isinstance(key_version_value, str):
+        return None
+    return key_version_value
+
+# END OF: get_version_from_header()
+
+
+def print_lines(lines):
+    '''
+    Description:
+    * Prints a group of lines, e.g., an error message, with a single write to stdout.
+    * It's used in place of a sequence of print() calls.
 
+    Parameter: lines, a list of strings, one per line
     '''
-    ############
-    # yamllint is used to verify the parameter-file's YAML syntax. 
-    ############
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# END OF: print_lines()
+
+
+def print_cerberus_errors(cerberus_errors):
+    '''
+    Description:
+    * Prints the Cerberus errors, using pprint++, a pretty-printer app.
+      * pprint++ docs: https://github.com/wolever/pprintpp
+    * pprint++ is only needed when a parameter-file has errors.  So, it's imported
+      and its pretty-printer is created on the first call.
+
+    Parameter: cerberus_errors, the Cerberus Validator's errors
+    '''
+    global PRETTY_PRINTER
+    if PRETTY_PRINTER == None:
+        try:
+            import pprintpp
+        except ImportError as e:
+            print("")
+            print("ERROR.  Could not import a required Python module.")
+            print("        The installation instructions specify the required modules.")
+            print("        Import-error description:")
+            print("")
+            print(e)
+            print("")    
+            sys.exit()
+        PRETTY_PRINTER = pprintpp.PrettyPrinter()
+    PRETTY_PRINTER.pprint(cerberus_errors)
+
+# END OF: print_cerberus_errors()
+
+
+def verify_yaml_syntax(parameter_file_text):
+    '''
+    Description:
+    * yamllint is used to verify the parameter-file's YAML syntax.
+    * If yamllint finds errors, they are written to the console.
+
+    Parameter: parameter_file_text, the parameter-file's contents
+
+    Return
+    * 1 : Error
+    * 0 : No errors found
     '''
     print("INFO.  Verifying the parameter-file's YAML syntax. (Calling yamllint.)")
     # Call yamllint
     # * A yamllint config-file is used, which is distrubted with WordWebNav.
     # * The config-file's name is defined above in: YAMLLINT_CONFIG_FILE_NAME
-    program_directory = os.path.dirname(os.path.realpath(__file__))
-    yamllint_config_file_path = os.path.join(program_directory, YAMLLINT_CONFIG_FILE_NAME)
-    print("INFO.  Opening the config-file for yamllint:")
-    print("       " + yamllint_config_file_path)
-    try:
-        # YamlLintConfig():  https://github.com/adrienverge/yamllint/blob/master/yamllint/config.py
-        yamllint_configuration = YamlLintConfig(file=yamllint_config_file_path)
-    except IOError as e:
-        print("")
-        print("ERROR.  Could not open the config-file for yamllint.")
-        print("        %s - %s." % (e.strerror, e.filename))
-        print("")        
-        parameter_file_handle.close()
-        return 1, None
+    # * The config-file is loaded once, into YAMLLINT_CONFIGURATION.  Later calls reuse it.
+    global YAMLLINT_CONFIGURATION
+    if YAMLLINT_CONFIGURATION == None:
+        program_directory = os.path.dirname(os.path.realpath(__file__))
+        yamllint_config_file_path = os.path.join(program_directory, YAMLLINT_CONFIG_FILE_NAME)
+        print_lines([
+            "INFO.  Opening the config-file for yamllint:",
+            "       " + yamllint_config_file_path
+        ])
+        try:
+            # YamlLintConfig():  https://github.com/adrienverge/yamllint/blob/master/yamllint/config.py
+            YAMLLINT_CONFIGURATION = YamlLintConfig(file=yamllint_config_file_path)
+        except IOError as e:
+            print_lines([
+                "",
+                "ERROR.  Could not open the config-file for yamllint.",
+                "        %s - %s." % (e.strerror, e.filename),
+                ""
+            ])
+            return 1
+    yamllint_configuration = YAMLLINT_CONFIGURATION
 
     # If yamllint finds errors, write them to the console and exit.
     # * The linter's error output:  https://yamllint.readthedocs.io/en/stable/development.html
 
     # The linter returns a generator, for the errors found.
     # * Convert the generator to a list.
-    yaml_error_list = list(yamllint.linter.run(parameter_file_handle, yamllint_configuration))
+    # * At most MAX_YAMLLINT_ERRORS errors are taken from the generator, so the linter
+    #   does not check the rest of a parameter-file that has many errors.
+    yaml_error_list = list(itertools.islice(
+        yamllint.linter.run(parameter_file_text, yamllint_configuration), MAX_YAMLLINT_ERRORS))
     if len(yaml_error_list) > 0:
-        print("")
-        print("ERROR.  yamllint found syntax errors in the parameter-file.")
-        print("        A reported error may be caused by a problem earlier in the file.")
+        print_lines([
+            "",
+            "ERROR.  yamllint found syntax errors in the parameter-file.",
+            "        A reported error may be caused by a problem earlier in the file."
+        ])
         for message in yaml_error_list:
             if message.rule != None:
                 yamllint_rule = str(message.rule)
@@ -363,51 +452,141 @@ def load_input_parameter_file(parameter_file_path : str):
                 yaml_error_description = message.desc
             else:
                 yaml_error_description = "[not specified]"
-            print("")
-            print("ERROR.  Error on line: " + yaml_error_line)
-            print("        yammllint rule-type: " + yamllint_rule)
-            print("        yamllint error-description:")
-            print(yaml_error_description)
+            print_lines([
+                "",
+                "ERROR.  Error on line: " + yaml_error_line,
+                "        yammllint rule-type: " + yamllint_rule,
+                "        yamllint error-description:",
+                yaml_error_description
+            ])
+
+        if len(yaml_error_list) == MAX_YAMLLINT_ERRORS:
+            print_lines([
+                "",
+                "INFO.  Only the first " + str(MAX_YAMLLINT_ERRORS) + " yamllint errors are reported."
+            ])
+        print_lines([
+            "",
+            "INFO.  yamllint documentation: https://yamllint.readthedocs.io/en/stable/",
+            "       yamllint rule-types: https://yamllint.readthedocs.io/en/stable/rules.html"
+        ])
+        return 1
+
+    return 0
+
+# END OF: verify_yaml_syntax()
+
 
+def load_input_parameter_file(parameter_file_path : str):
+    '''
+    Description:
+    * Loads the WWN input parameter-file, and verifies it
+    
+    Operation:
+    * Verifies the input parameter-file's syntax
+    * yamllint is used to verify the parameter-file's YAML syntax. 
+      (Only if STRICT_YAML_LINT is True.)
+    * PyYAML's YAML-loader is used to load the parameter-file into a Python
+      object, made-up of dictionaries and lists.
+    * Cerberus is used to verify the parameter-file's syntax, using a schema.
+    * Verifies the WordWebNav version that is specified in the parameter-file
+    * The syntax verification is further described in the WWN development-documents.
+      The documents are:
+      * In the repo, under /docs/development-docs
+      * On the WWN web-site
+
+    Parameter: parameter_file_path, specifies the input parameter-file's path
+
+    Return
+    * 1, None : Error
+    * 0, loaded_parms : loaded_parms is a dictionary with the input parameter-file's
+                        contents
+    '''    
+
+    # Open the input parameter-file, and read it
+    # * The file is read once.  The text is used by both yamllint and the YAML-loader.
+    # * YAML files are encoded in UTF-8.
+    print_lines([
+        "INFO.  Processing the parameter-file:",
+        "       " + parameter_file_path
+    ])
+    try:
+        with open(parameter_file_path, "r", encoding="utf-8") as parameter_file_handle:
+            parameter_file_text = parameter_file_handle.read()
+    except IOError as e:
+        print_lines([
+            "",
+            "ERROR.  Could not open the parameter-file.",
+            "        %s - %s." % (e.strerror, e.filename),
+            ""
+        ])
+        return 1, None
+    except UnicodeDecodeError as e:
+        print_lines([
+            "",
+            "ERROR.  Could not read the parameter-file.  It is not UTF-8 encoded.",
+            "        " + str(e),
+            ""
+        ])
+        return 1, None
+
+    # Check the WordWebNav version in the start of the parameter-file
+    # * If the version is found and it's incorrect, the parameter-file is rejected
+    #   without the full verification below.
+    # * If the version is not found, it's verified after the full verification.
+    key_version_value = get_version_from_header(parameter_file_text)
+    if (key_version_value != None) and (key_version_value != "1.0"):
         print("")
-        print("INFO.  yamllint documentation: https://yamllint.readthedocs.io/en/stable/")        
-        print("       yamllint rule-types: https://yamllint.readthedocs.io/en/stable/rules.html")
-        parameter_file_handle.close()
+        print( "ERROR.  Error in the parameter-file.  In section \"" + YML_KEY_REQUIRED + \
+               "\", the key \"" + YML_KEY_VERSION + "\" has an incorrect value: " + key_version_value )
         return 1, None
 
+    '''
+    ############
+    # yamllint is used to verify the parameter-file's YAML syntax. 
+    # * It's only used if STRICT_YAML_LINT is True
+    ############
+    '''
+    if STRICT_YAML_LINT:
+        return_value = verify_yaml_syntax(parameter_file_text)
+        if return_value == 1:
+            return 1, None
+
     '''
     ################
     # PyYAML's YAML-loader is used to load the parameter-file
     ################
     '''
-    # Read in the parameter-file, for use by the YAML-loader.
-    # * The file-pointer is first reset to the beginning
-    parameter_file_handle.seek(0)
-    parameter_file_text = parameter_file_handle.read()
-    parameter_file_handle.close()
-
+    # The parameter-file's text was read earlier, in parameter_file_text
     print("INFO.  Loading the parameter-file, using PyYAML's YAML-loader.")
     try:
         # Call the YAML-loader
         # * yaml.load's exceptions:  https://pyyaml.org/wiki/PyYAMLDocumentation
-        loaded_parms = yaml.load(parameter_file_text, Loader=yaml.FullLoader)
+        # * The loader is specified above, in YAML_LOADER
+        loaded_parms = yaml.load(parameter_file_text, Loader=YAML_LOADER)
     except yaml.YAMLError as e:
-        print("")
-        print("ERROR.  The YAML-loader was not able to load the parameter-file.")
+        print_lines([
+            "",
+            "ERROR.  The YAML-loader was not able to load the parameter-file."
+        ])
         if hasattr(e, 'problem_mark'):
             mark = e.problem_mark
             print("        Error in the parameter-file on, or near, line: " + str(mark.line+1))
-        print("        Error-message from the YAML-loader:")
-        print(e)
-        print("")
-        print("INFO.  PyYAML documentation: https://pyyaml.org/wiki/PyYAMLDocumentation")
+        print_lines([
+            "        Error-message from the YAML-loader:",
+            str(e),
+            "",
+            "INFO.  PyYAML documentation: https://pyyaml.org/wiki/PyYAMLDocumentation"
+        ])
         return 1, None
 
     # This can happen if the input file just has a line "---"
     if (loaded_parms == None):
-        print("")
-        print("ERROR.  The YAML-loader did not load anything.")
-        print("        The parameter-file appears to be in error, e.g., has no keys.")
+        print_lines([
+            "",
+            "ERROR.  The YAML-loader did not load anything.",
+            "        The parameter-file appears to be in error, e.g., has no keys."
+        ])
         return 1, None
 
     '''
@@ -417,34 +596,36 @@ def load_input_parameter_file(parameter_file_path : str):
     ###################
     '''
     print("INFO.  Using Cerberus to verify the parameter-file's syntax.")
-    # Create an instance of the Cerberus Validator
-    cerberus_validator = Validator()
+    # The Cerberus Validator is created once, with the schema, in: CERBERUS_VALIDATOR
+    cerberus_validator = CERBERUS_VALIDATOR
     # Validate the parameter-file, using the schema
     # * By default, Cerberus will flag keys that are not defined in the schema.
     # * Cerberus can crash with some invlaid inputs (e.g., loaded_parms == None), so use try/except.
     try:
-        validation_result = cerberus_validator.validate(loaded_parms, PARAMETER_FILE_SCHEMA)
+        validation_result = cerberus_validator.validate(loaded_parms)
     except:
-        print("")
-        print("ERROR.  An exception was raised in Cerberus.")
-        print("        The parameter-file is likely to be in error.")
+        print_lines([
+            "",
+            "ERROR.  An exception was raised in Cerberus.",
+            "        The parameter-file is likely to be in error."
+        ])
         return 1, None
 
     # Check if errors were found
     if validation_result == False:
-        print("")
-        print("ERROR.  An error was found in the parameter-file.")
-        print("        The error message is below.  It is from Cerberus.")
-        print("        Cerberus's error messages can be difficult to read.")
-        print("        * The error-message typically includes:")
-        print("          * Specification of the relevant key-name(s), e.g., {'web_page_files': [{'output_directory_path': ...")
-        print("          * Followed by an error descripton, e.g., ['null value not allowed']")
-        print("        * The docs have more info on the Cerberus error messages.")
-        print("")
+        print_lines([
+            "",
+            "ERROR.  An error was found in the parameter-file.",
+            "        The error message is below.  It is from Cerberus.",
+            "        Cerberus's error messages can be difficult to read.",
+            "        * The error-message typically includes:",
+            "          * Specification of the relevant key-name(s), e.g., {'web_page_files': [{'output_directory_path': ...",
+            "          * Followed by an error descripton, e.g., ['null value not allowed']",
+            "        * The docs have more info on the Cerberus error messages.",
+            ""
+        ])
         # The Cerberus error-message is formatted using pprint++, a pretty-printer app.
-        # * pprint++ docs: https://github.com/wolever/pprintpp
-        pretty_printer = pprintpp.PrettyPrinter()
-        pretty_printer.pprint(cerberus_validator.errors)     
+        print_cerberus_errors(cerberus_validator.errors)
         return 1, None
 
     '''
@@ -0,0 +1,16 @@
+'''
+################
+pytest configuration for the tests in this directory
+
+Run from the repo's root directory:  python -m pytest tests
+* pytest is listed in requirements-dev.txt
+
+MIT License, Copyright (c) 2021-present Jim Yuill
+################
+'''
+
+import os
+import sys
+
+# The createwebpage modules import each other by module name, so their directory is put on the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "createwebpage"))
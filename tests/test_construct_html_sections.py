@@ -0,0 +1,35 @@
+'''
+################
+Tests for createwebpage/construct_html_sections.py
+
+Run from the repo's root directory:  python -m pytest tests
+
+MIT License, Copyright (c) 2021-present Jim Yuill
+################
+'''
+
+from bs4 import BeautifulSoup
+
+from input_parameter_file_keys import *
+import construct_html_sections
+
+
+def test_table_of_contents_uses_minimal_formatter():
+    # * The TOC paragraphs are moved from the document-text into the TOC.
+    # * The "minimal" formatter only escapes &, < and >.
+    #   "&nbsp;" and other named entities are output as characters.
+    word_html = ("<html><head><meta name=Generator content=\"Microsoft Word 15 (filtered)\"></head>"
+                 "<body lang=EN-US><p class=MsoToc1><span class=MsoHyperlink>"
+                 "<a href=\"#_Toc1\">Caf&eacute; &amp; Co&nbsp;Ltd</a></span></p>"
+                 "<p class=MsoNormal>Document text</p></body></html>")
+    soup = BeautifulSoup(word_html, "html.parser")
+    loaded_parms = {YML_KEY_REQUIRED: {YML_KEY_VERSION: "1.0",
+                                       YML_KEY_SCRIPTS_DIRECTORY_URL: "https://example.com/wwn/"}}
+    jinja_template_variables = {}
+    return_value, body_inner_html = construct_html_sections.construct_html_sections(
+        loaded_parms, jinja_template_variables, soup.head, soup.body)
+    assert return_value == 0
+    assert jinja_template_variables['table_of_contents'] == (
+        "<p class=\"MsoToc1\"><span class=\"MsoHyperlink tocAnchor\">"
+        "<a class=\"tocAnchor\" href=\"#_Toc1\">Caf\xe9 &amp; Co\xa0Ltd</a></span></p>")
+    assert body_inner_html.find('p', class_="MsoToc1") == None
@@ -0,0 +1,217 @@
+'''
+################
+Tests for createwebpage/fix_word_html.py
+
+Run from the repo's root directory:  python -m pytest tests
+
+MIT License, Copyright (c) 2021-present Jim Yuill
+################
+'''
+
+import pytest
+
+from bs4 import BeautifulSoup
+
+from input_parameter_file_keys import *
+import fix_word_html
+
+
+def run_fix_word_html(body_html, white_colored_text=YML_DO_NOT_REMOVE):
+    '''
+    Calls fix_word_html() for the input body-HTML, and returns: return_value, generated_html
+    '''
+    loaded_parms = {YML_KEY_WORD_HTML_EDITS: {YML_KEY_WHITE_COLORED_TEXT: white_colored_text}}
+    jinja_template_variables = {}
+    body_inner_html = BeautifulSoup(body_html, "html.parser")
+    return_value, num_warning_messages = fix_word_html.fix_word_html(loaded_parms,
+                                            jinja_template_variables, body_inner_html, 0)
+    return return_value, jinja_template_variables.get('document_text')
+
+
+def unordered_list_item_html(font_family, bullet_symbol):
+    '''
+    Returns the HTML for an unordered-list list-item, in the form Word generates
+    '''
+    return ("<p class=MsoListParagraphCxSpFirst style='text-indent:-.25in'>"
+            "<span style='font-family:" + font_family + "'>" + bullet_symbol +
+            "<span style='font:7.0pt \"Times New Roman\"'>&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp; "
+            "</span></span>List-item text</p>")
+
+
+'''
+#########
+test_if_span_with_only_spaces()
+#########
+'''
+
+@pytest.mark.parametrize("span_html, expected", [
+    # "&nbsp;" is parsed into "\xa0".  Other whitespace can be mixed-in.
+    ("<span style='x'>&nbsp;</span>", True),
+    ("<span style='x'>&nbsp;&nbsp; \n</span>", True),
+    # At least one "&nbsp;" is required
+    ("<span style='x'>   </span>", False),
+    ("<span style='x'>&nbsp;a</span>", False),
+    # The span must have a style attribute, and a single string
+    ("<span>&nbsp;</span>", False),
+    ("<span style='x'>&nbsp;<b>&nbsp;</b></span>", False),
+    # A comment is not the span's text
+    ("<span style='x'><!--&nbsp;--></span>", False),
+    ("<b style='x'>&nbsp;</b>", False),
+])
+def test_span_with_only_spaces(span_html, expected):
+    element = BeautifulSoup(span_html, "html.parser").contents[0]
+    assert fix_word_html.test_if_span_with_only_spaces(element) == expected
+
+
+'''
+#########
+parse_style_attribute() and serialize_style_attribute()
+#########
+'''
+
+def test_style_attribute_round_trip():
+    style = "font-size:10.0pt;font-family:\"Courier New\";color:white"
+    style_dict = fix_word_html.parse_style_attribute(style)
+    assert style_dict == {"font-size": "10.0pt", "font-family": "\"Courier New\"", "color": "white"}
+    assert fix_word_html.serialize_style_attribute(style_dict) == style
+
+
+def test_style_attribute_whitespace_removed():
+    # Word-HTML can have a newline between the style's properties
+    style_dict = fix_word_html.parse_style_attribute("margin-left:.5in;\ntext-indent: -.25in")
+    assert style_dict == {"margin-left": ".5in", "text-indent": "-.25in"}
+    assert fix_word_html.serialize_style_attribute(style_dict) == "margin-left:.5in;text-indent:-.25in"
+
+
+def test_style_attribute_value_with_colon():
+    # The declaration is split at its first ":"
+    style_dict = fix_word_html.parse_style_attribute("background:url(http://example.com/a.png)")
+    assert style_dict == {"background": "url(http://example.com/a.png)"}
+
+
+def test_style_attribute_not_round_tripped():
+    # * A declaration without ":" is dropped.
+    # * The trailing ";" is dropped.
+    style_dict = fix_word_html.parse_style_attribute("mso-list:l0 level1 lfo1;bogus;color:red;")
+    assert style_dict == {"mso-list": "l0 level1 lfo1", "color": "red"}
+    assert fix_word_html.serialize_style_attribute(style_dict) == "mso-list:l0 level1 lfo1;color:red"
+
+
+'''
+#########
+classify_unordered_list_item(), and the unordered-list fixes in fix_word_html()
+#########
+'''
+
+@pytest.mark.parametrize("font_family, bullet_symbol, expected_key", [
+    ("Symbol", chr(183), fix_word_html.FIX_KEY_SOLID_DOT_BULLET),
+    ("Wingdings", chr(167), fix_word_html.FIX_KEY_SOLID_SQUARE_BULLET),
+    ("\"Courier New\"", "o", fix_word_html.FIX_KEY_LETTER_O_BULLET),
+])
+def test_classify_unordered_list_item(font_family, bullet_symbol, expected_key):
+    paragraph = BeautifulSoup(unordered_list_item_html(font_family, bullet_symbol), "html.parser").p
+    html_entity_encodings_key, first_string, second_string = \
+        fix_word_html.classify_unordered_list_item(paragraph)
+    assert html_entity_encodings_key == expected_key
+    assert first_string == bullet_symbol
+    assert second_string.startswith("\xa0")
+
+
+def test_bullet_symbols_mapping():
+    assert fix_word_html.UNORDERED_LIST_BULLET_SYMBOLS == {
+        ("Symbol", chr(183)): fix_word_html.FIX_KEY_SOLID_DOT_BULLET,
+        ("Wingdings", chr(167)): fix_word_html.FIX_KEY_SOLID_SQUARE_BULLET,
+        ("\"Courier New\"", "o"): fix_word_html.FIX_KEY_LETTER_O_BULLET,
+    }
+
+
+@pytest.mark.parametrize("paragraph_html", [
+    # The font-family doesn't match the bullet-symbol
+    unordered_list_item_html("Arial", chr(183)),
+    unordered_list_item_html("Symbol", "o"),
+    # The spaces after the bullet-symbol have no "&nbsp;"
+    ("<p class=MsoListParagraph style='text-indent:-.25in'><span style='font-family:Symbol'>" +
+     chr(183) + "<span style='font:7.0pt'>   </span></span>List-item text</p>"),
+    # The spaces' span tag is not a child of the bullet-symbol's span tag
+    ("<p class=MsoListParagraph style='text-indent:-.25in'><span style='font-family:Symbol'>" +
+     chr(183) + "</span><span style='font:7.0pt'>&nbsp;&nbsp;</span>List-item text</p>"),
+    # Only one string
+    "<p class=MsoNormal style='text-indent:-.25in'><span style='font-family:Symbol'>" + chr(183) + "</span></p>",
+])
+def test_classify_unordered_list_item_not_list_item(paragraph_html):
+    paragraph = BeautifulSoup(paragraph_html, "html.parser").p
+    assert fix_word_html.classify_unordered_list_item(paragraph) == None
+
+
+@pytest.mark.parametrize("font_family, bullet_symbol, expected_bullet_symbol", [
+    ("Symbol", chr(183), chr(9679)),
+    ("Wingdings", chr(167), chr(9632)),
+    # The letter "o" is not replaced.  Just its spacing is fixed.
+    ("\"Courier New\"", "o", "o"),
+])
+def test_unordered_list_item_fixed(font_family, bullet_symbol, expected_bullet_symbol):
+    # * The bullet-symbol is replaced, if needed.
+    # * The spaces after the bullet-symbol are replaced with six "&nbsp;"s.
+    return_value, generated_html = run_fix_word_html(unordered_list_item_html(font_family, bullet_symbol))
+    assert return_value == 0
+    assert (expected_bullet_symbol + "<span style='font:7.0pt \"Times New Roman\"'>" + 
+            fix_word_html.SIX_NBSPS + "</span></span>List-item text</p>") in generated_html
+
+
+'''
+#########
+Output of the document-text's HTML
+#########
+'''
+
+def test_generated_html_uses_minimal_formatter():
+    # * The "minimal" formatter only escapes &, < and >.
+    # * "&nbsp;" and other named entities are output as characters.
+    body_html = "<p class=MsoNormal>Caf&eacute; &amp; Co&nbsp;Ltd &lt;b&gt;</p>"
+    return_value, generated_html = run_fix_word_html(body_html)
+    assert return_value == 0
+    assert generated_html == "<p class=\"MsoNormal\">Caf\xe9 &amp; Co\xa0Ltd &lt;b&gt;</p>"
+
+
+'''
+#########
+color:white processing in fix_word_html()
+#########
+'''
+
+def test_color_white_removed_with_commented_out_span():
+    # A commented-out span tag, with "color:white", is not a span tag.
+    # * It must not be edited, and it must not cause an error.
+    body_html = ("<!-- old: <span style='color:white'>hidden</span> -->"
+                 "<p class=MsoNormal><span style='color:white'>one</span></p>"
+                 "<div><span style='font-size:10pt;color:white'>two</span></div>")
+    return_value, generated_html = run_fix_word_html(body_html, YML_REMOVE_ALL)
+    assert return_value == 0
+    assert "<!-- old: <span style='color:white'>hidden</span> -->" in generated_html
+    assert "<span>one</span>" in generated_html
+    assert "<span style=\"font-size:10pt\">two</span>" in generated_html
+
+
+def test_color_white_removed_in_paragraphs_only():
+    body_html = ("<p class=MsoNormal><span style='color:white'>one</span></p>"
+                 "<div><span style='color:white'>two</span></div>")
+    return_value, generated_html = run_fix_word_html(body_html, YML_REMOVE_IN_PARAGRAPHS)
+    assert return_value == 0
+    assert "<span>one</span>" in generated_html
+    assert "<span style=\"color:white\">two</span>" in generated_html
+
+
+def test_color_white_not_removed_but_reported(capsys):
+    body_html = ("<p class=MsoNormal><span style='color:white'>one</span></p>"
+                 "<div><span style='color:whitesmoke'>two</span></div>")
+    loaded_parms = {}
+    jinja_template_variables = {}
+    body_inner_html = BeautifulSoup(body_html, "html.parser")
+    return_value, num_warning_messages = fix_word_html.fix_word_html(loaded_parms,
+                                            jinja_template_variables, body_inner_html, 0)
+    assert return_value == 0
+    assert num_warning_messages == 1
+    assert "<span style=\"color:white\">one</span>" in jinja_template_variables['document_text']
+    output = capsys.readouterr().out
+    assert "Within an HTML paragraph: 1;  Not within an HTML paragraph: 0" in output
+    assert "WARNING.  Span tag(s) found" in output
@@ -0,0 +1,59 @@
+'''
+################
+Tests for createwebpage/load_html_files.py
+
+Run from the repo's root directory:  python -m pytest tests
+
+MIT License, Copyright (c) 2021-present Jim Yuill
+################
+'''
+
+import pytest
+
+from input_parameter_file_keys import *
+import load_html_files
+
+
+WORD_HTML = ("<html><head><meta name=Generator content=\"Microsoft Word 15 (filtered)\"></head>"
+             "<body lang=EN-US><div class=WordSection1><p class=MsoNormal>Caf&eacute;</p></div>"
+             "</body></html>")
+
+
+def run_load_html_files(tmp_path):
+    '''
+    Calls load_html_files() for a Word HTML-file written to tmp_path, and returns:
+    return_value, returned_objects_dict
+    '''
+    input_html_path = tmp_path / "document.htm"
+    input_html_path.write_text(WORD_HTML, encoding="utf-8")
+    output_directory_path = tmp_path / "output"
+    output_directory_path.mkdir()
+    loaded_parms = {YML_KEY_REQUIRED: {YML_KEY_INPUT_HTML_PATH: str(input_html_path),
+                                       YML_KEY_OUTPUT_DIRECTORY_PATH: str(output_directory_path)}}
+    return_value, returned_objects_dict = load_html_files.load_html_files(loaded_parms)
+    if (returned_objects_dict != None):
+        returned_objects_dict["output_html_file_handle"].close()
+    return return_value, returned_objects_dict
+
+
+def test_load_html_files_with_lxml(tmp_path, monkeypatch):
+    pytest.importorskip("lxml")
+    monkeypatch.setattr(load_html_files, "HTML_PARSER", "lxml")
+    return_value, returned_objects_dict = run_load_html_files(tmp_path)
+    assert return_value == 0
+    assert returned_objects_dict["body"].find('p', class_="MsoNormal").string == "Caf\xe9"
+
+
+def test_load_html_files_parser_not_found(tmp_path, monkeypatch):
+    # If BeautifulSoup can't use HTML_PARSER, Python's built-in parser is used
+    monkeypatch.setattr(load_html_files, "HTML_PARSER", "no-such-parser")
+    return_value, returned_objects_dict = run_load_html_files(tmp_path)
+    assert return_value == 0
+    assert returned_objects_dict["body"].find('p', class_="MsoNormal").string == "Caf\xe9"
+
+
+def test_load_html_files_returns_verified_template(tmp_path):
+    # The template returned is the one whose signature was verified
+    return_value, returned_objects_dict = run_load_html_files(tmp_path)
+    assert return_value == 0
+    assert returned_objects_dict["jinja_template"] is load_html_files.JINJA_TEMPLATE
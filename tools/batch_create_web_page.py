@@ -10,6 +10,9 @@ Description:
     * To create the file, the following are used: 
       * The input config-file, the path to the input .htm* file, and Jinja2
   * Call create_web_page.py, and provide the path to the WWN input parameter-file
+* The .htm* files are processed in parallel, by a pool of worker processes
+  * Each file is processed independently of the others.
+  * Each file's output is written as one block, after the file is processed.
 
 Inputs:
 * Command-line input: Path to the directory containing the Word HTML-files.
@@ -25,21 +28,37 @@ Inputs:
 import argparse
 import sys
 import os
+import io
+import contextlib
 
-from os import listdir
-from os.path import isfile, join
+from os.path import join
 
-from importlib import reload
+from concurrent.futures import ProcessPoolExecutor
 
-from jinja2 import Template
+from jinja2 import Environment, DictLoader
 
 sys.path.append(r'..\createwebpage')
 import create_web_page
+import load_input_parameter_file
 
 CONFIG_FILE_NAME_ROOT = "batch_create_web_page"
 
+# File-name extensions for the Word HTML-files, in lower-case
+WORD_HTML_FILE_EXTENSIONS = frozenset((".htm", ".html"))
+
+# Number of worker processes used to process the Word HTML-files
+# * os.cpu_count() returns None if the number of CPUs can't be determined.  Then, one worker is used.
+# * On Windows, ProcessPoolExecutor raises ValueError if max_workers is more than 61.
+MAX_WORKERS = min(os.cpu_count() or 1, 61)
+
+# The config-file's Jinja template, compiled once in each worker process
+# * It's set by init_worker()
+CONFIG_FILE_TEMPLATE = None
+# The name the config-file's template is given, in the Jinja environment
+CONFIG_FILE_TEMPLATE_NAME = "config_file"
+
 '''
-Argparse is used to process the command-line argument 
+Argparse is used to process the command-line arguments
 * Argparse docs: https://docs.python.org/3/library/argparse.html
 * The argparse code here is from:  https://stackoverflow.com/questions/14360389/getting-file-path-from-command-line-argument-in-python/47324233
 '''
@@ -49,19 +68,121 @@ def create_arg_parser():
         'Calls create_web_page.py, for the Word HTML-files at the specified directory.')
     parser.add_argument('input_dir_path', metavar="<input-dir-path>",
                     help='Path to the directory containing the Word HTML-files.')
+    parser.add_argument('--strict', action='store_true',
+                    help='Also use yamllint to verify the WWN input parameter-files.')
     return parser
 
+
+def compile_config_file_template(config_file_data):
+    '''
+    * Description:
+      * Compiles the config-file's Jinja template, and returns it.
+      * The template is loaded through a Jinja Environment, with the template's source in a DictLoader.
+        * auto_reload=False: the source can't change, so Jinja doesn't check if it's up-to-date.
+        * cache_size=1: the environment only has the one template.
+
+    * Input:
+      * config_file_data: the config-file's contents, which is a Jinja template
+    '''
+    jinja_environment = Environment(loader=DictLoader({CONFIG_FILE_TEMPLATE_NAME: config_file_data}),
+                                    auto_reload=False, cache_size=1)
+    return jinja_environment.get_template(CONFIG_FILE_TEMPLATE_NAME)
+
+# END OF: compile_config_file_template()
+
+
+def init_worker(config_file_data, strict_yaml_lint):
+    '''
+    * Description:
+      * Initializes a worker process.  It's called once, when the worker process starts.
+      * Compiles the config-file's Jinja template, and saves it in CONFIG_FILE_TEMPLATE.
+        The template is then reused for each Word HTML-file the worker processes.
+      * Specifies if yamllint is used to verify the WWN input parameter-files
+
+    * Input:
+      * config_file_data: the config-file's contents, which is a Jinja template
+      * strict_yaml_lint: True if yamllint is used
+    '''
+    global CONFIG_FILE_TEMPLATE
+    CONFIG_FILE_TEMPLATE = compile_config_file_template(config_file_data)
+    load_input_parameter_file.STRICT_YAML_LINT = strict_yaml_lint
+
+# END OF: init_worker()
+
+
+def process_word_html_file(file_name, input_dir_path):
+    '''
+    * Description:
+      * Processes one Word HTML-file:
+        * Creates its WWN input parameter-file, and calls create_web_page.create_web_page()
+      * It's run in a worker process, so it's a top-level function (it must be picklable).
+      * The config-file's Jinja template was compiled by init_worker().
+      * The file's console output is buffered, and then written with a single write.
+        So, the output for a file isn't interleaved with output from other worker processes.
+
+    * Input:
+      * file_name: the Word HTML-file's name
+      * input_dir_path: path to the directory containing the Word HTML-file
+
+    * Return:
+      * return_value, num_warning_messages : from create_web_page.create_web_page()
+    '''
+    # * The buffered output is written in "finally", so it's written even if 
+    #   create_web_page() raises an exception.
+    file_output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(file_output):
+            print("\nINFO.  Processing the Word HTML-file:  " + file_name)
+
+            '''
+            For this Word HTML-file, create the WWN input parameter-file that will be used by create_web_page.py, 
+            '''
+
+            # Create the file-name for the WWN input parameter-file 
+            file_name_root, file_name_extension =  os.path.splitext(file_name)
+            wwn_input_parameter_file_name = file_name_root + ".yml"
+            wwn_input_parameter_file_path = join(input_dir_path, wwn_input_parameter_file_name)
+
+            # Use Jinja to generate the data for the WWN input parameter-file 
+            file_path = join(input_dir_path, file_name)
+            wwn_input_parameter_file_data = CONFIG_FILE_TEMPLATE.render({'inputHtmlPath':file_path})
+
+            # Write the WWN input parameter-file to disk
+            # * The file is written in one call.  
+            # * newline="" turns off newline translation, so the rendered text is written as-is.
+            # * The file is UTF-8 encoded, as create_web_page.py reads it as UTF-8.
+            print("INFO.  Creating the WWN input parameter-file used by create_web_page.py:  " + \
+                  wwn_input_parameter_file_name)
+            with open(wwn_input_parameter_file_path, "w", encoding="utf-8", newline="") as wwn_input_parameter_file_handle:
+                wwn_input_parameter_file_handle.write(wwn_input_parameter_file_data)
+
+            '''
+            Call create_web_page.main(), pass it the path to the WWN input parameter-file
+            * Each worker process has its own copy of the create_web_page module, 
+              so create_web_page is not reloaded.
+            '''
+            return create_web_page.create_web_page(wwn_input_parameter_file_path)
+    finally:
+        sys.stdout.write(file_output.getvalue())
+        sys.stdout.flush()
+
+# END OF: process_word_html_file()
+
+
 '''
 #########
 Main
 #########
 '''
 if __name__ == "__main__":
-    # Get the directory path from the command-line
+    # Get the directory path, and the --strict option, from the command-line
     # * argparser also verifies the command-line syntax
+    # * By default, yamllint is not used to verify the WWN input parameter-files, to speed-up
+    #   batch processing.  They are still verified by PyYAML's YAML-loader and by Cerberus.
     arg_parser = create_arg_parser()
     parsed_args = arg_parser.parse_args()
     input_dir_path = parsed_args.input_dir_path
+    strict_yaml_lint = parsed_args.strict
 
     '''
     * A config-file is expected, in the input directory.
@@ -89,8 +210,9 @@ if __name__ == "__main__":
         sys.exit()  
 
     # Open the expected config-file
+    # * The config-file is read as UTF-8, the encoding used to write the WWN input parameter-files.
     try:
-        config_file_handle = open(config_file_path)
+        config_file_handle = open(config_file_path, encoding="utf-8")
     except IOError as e:
         print("")
         print("ERROR.  Could not open the config-file:")
@@ -99,76 +221,60 @@ if __name__ == "__main__":
         sys.exit()  
     config_file_data = config_file_handle.read()
     config_file_handle.close()
-    config_file_template = Template(config_file_data)
+    # Verify the config-file can be used as a Jinja template
+    # * The compiled template isn't kept.  Each worker process compiles the template once, in init_worker()
+    compile_config_file_template(config_file_data)
 
 
     # For the input directory, create a list of files with extension .htm or .html
-    all_files = [item for item in listdir(input_dir_path) if isfile(join(input_dir_path, item))]
-    word_html_files = []
-    word_html_file_roots = []
-    for file_name in all_files:
-        file_name_root, file_name_extension =  os.path.splitext(file_name)
-        if (file_name_extension.lower() == ".html") or (file_name_extension.lower() == ".htm"):
-            word_html_files.append(file_name)
-            word_html_file_roots.append(file_name_root)
-
+    # * os.scandir() returns the directory entries with their file-type, so a separate
+    #   stat of each file (e.g., by os.path.isfile()) is not needed.
     # * Test if there's two files whose names have the same root-name, and the extensions .htm and .html,
     #   e.g., "foo.htm" and "foo.html".
     # * This isn't allowed because a config-file is created for each HTML file, for calling create_web_page.
     #   The config-file's name is derived from the HTML-file's root-name: <root-name>.yml.
     #   So, two HTML files cannot have the same root-name.
-    # * set() converts the list to a set, and thus removes duplicates
-    if len(word_html_file_roots) != len(set(word_html_file_roots)):
-        print("")
-        print("ERROR.  The input directory has two files with the same root-name and with " +
-              " extensions \".htm\" and \".html\"")
-        print("")
-        sys.exit()  
+    # * The test is done while scanning the directory.  word_html_file_roots holds the root-names 
+    #   found so far.
+    word_html_files = []
+    word_html_file_roots = set()
+    with os.scandir(input_dir_path) as directory_entries:
+        for directory_entry in directory_entries:
+            if not directory_entry.is_file():
+                continue
+            file_name_root, file_name_extension =  os.path.splitext(directory_entry.name)
+            if file_name_extension.lower() in WORD_HTML_FILE_EXTENSIONS:
+                if file_name_root in word_html_file_roots:
+                    print("")
+                    print("ERROR.  The input directory has two files with the same root-name and with " +
+                          " extensions \".htm\" and \".html\"")
+                    print("")
+                    sys.exit()  
+                word_html_files.append(directory_entry.name)
+                word_html_file_roots.add(file_name_root)
 
     # Process each input Word HTML-file
+    # * The files are processed in parallel, by a pool of worker processes.
+    # * executor.map() returns the results in the same order as word_html_files.
     file_count = 0
     failed_file_count = 0
-    failed_file_names = ""
+    failed_file_names = []
     total_num_warning_messages = 0
-    for file_name in word_html_files:
-        file_count += 1
-        print("\nINFO.  Processing the Word HTML-file:  " + file_name)
-
-        '''
-        For this Word HTML-file, create the WWN input parameter-file that will be used by create_web_page.py, 
-        '''
-
-        # Create the file-name for the WWN input parameter-file 
-        file_name_root, file_name_extension =  os.path.splitext(file_name)
-        wwn_input_parameter_file_name = file_name_root + ".yml"
-        wwn_input_parameter_file_path = join(input_dir_path, wwn_input_parameter_file_name)
-
-        # Use Jinja to generate the data for the WWN input parameter-file 
-        file_path = join(input_dir_path, file_name)
-        wwn_input_parameter_file_data = config_file_template.render({'inputHtmlPath':file_path})
-
-        # Write the WWN input parameter-file to disk
-        print("INFO.  Creating the WWN input parameter-file used by create_web_page.py:  " + \
-              wwn_input_parameter_file_name)
-        wwn_input_parameter_file_handle = open(wwn_input_parameter_file_path, 'w')
-        wwn_input_parameter_file_handle.write(wwn_input_parameter_file_data)
-        wwn_input_parameter_file_handle.close()
-
-        '''
-        Call create_web_page.main(), pass it the path to the WWN input parameter-file
-        '''
-
-        # Reload needed to refresh the global variables
-        reload(create_web_page)
-        return_value, num_warning_messages = create_web_page.create_web_page(wwn_input_parameter_file_path)
-        if return_value == 1:
-            failed_file_count += 1
-            failed_file_names += file_name + ", "
-        total_num_warning_messages += num_warning_messages
+    num_files = len(word_html_files)
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS, initializer=init_worker,
+                             initargs=(config_file_data, strict_yaml_lint)) as executor:
+        results = executor.map(process_word_html_file, word_html_files, 
+                               [input_dir_path] * num_files)
+        for file_name, (return_value, num_warning_messages) in zip(word_html_files, results):
+            file_count += 1
+            if return_value == 1:
+                failed_file_count += 1
+                failed_file_names.append(file_name)
+            total_num_warning_messages += num_warning_messages
 
     print("\nBatch processing completed.")
     print("Files processed: " + str(file_count))
     print("Number of warning messages: " + str(total_num_warning_messages))    
     print("Files processed unsuccessfully:  Count:" + str(failed_file_count) + \
-          "  File-names: " + failed_file_names)
+          "  File-names: " + ", ".join(failed_file_names))
     print("")
\ No newline at end of file
@@ -5,6 +5,9 @@ Description:
   * The *.yml files must be WWN input parameter-files
 * This program was created for running regresion-tests
   * See: docs\development-docs\WWN--testing--regression-tests.docx
+* The *.yml files are processed in parallel, by a pool of worker processes
+  * Each file is processed independently of the others.
+  * Each file's output is written as one block, after the file is processed.
 
 Command-line input: the full path to a directory with WWN input parameter-files
 
@@ -13,12 +16,16 @@ Command-line input: the full path to a directory with WWN input parameter-files
 import argparse
 import sys
 import os
-
-from os import listdir
-from os.path import isfile, join
+import io
+import contextlib
+import traceback
+import concurrent.futures
 
 sys.path.append(r'..\createwebpage')
 import create_web_page
+import load_html_files
+
+from jinja2 import TemplateError
 
 '''
 Argparse is used to process the command-line argument 
@@ -31,11 +38,119 @@ def create_arg_parser():
         'Calls create_web_page.py, for the all of the *.yml files at the specified directory.')
     parser.add_argument('input_dir_path', metavar="<input-dir-path>",
                     help='Path to the directory containing the *.yml files.')
+    parser.add_argument('--io-budget-mbps', type=int, default=DEFAULT_IO_BUDGET_MBPS,
+                    help='Disk throughput available to the batch, in MB/s. (Default: %(default)s)')
+    parser.add_argument('--per-task-mbps', type=int, default=DEFAULT_PER_TASK_MBPS,
+                    help='Disk throughput used by processing one .yml file, in MB/s. (Default: %(default)s)')
     return parser
 
 MAX_FILES_TO_PROCESS = sys.maxsize
 #MAX_FILES_TO_PROCESS = 2
 
+# Maximum number of worker processes used to process the .yml files
+# * os.cpu_count() returns None if the number of CPUs can't be determined.  Then, one worker is used.
+# * On Windows, ProcessPoolExecutor raises ValueError if max_workers is more than 61.
+NUM_WORKER_PROCESSES = min(os.cpu_count() or 1, 61)
+
+# Defaults for the command-line options that limit the number of worker processes by disk throughput
+# * The number of worker processes is limited to:  io_budget_mbps // per_task_mbps
+# * This keeps the workers from saturating the disk, e.g., on a hard-drive or network file-system.
+DEFAULT_IO_BUDGET_MBPS = 2000
+DEFAULT_PER_TASK_MBPS = 200
+
+# Number of batches of .yml files, for each worker process
+# * Several smaller batches per worker are used, rather than one large batch, so the work is 
+#   load-balanced: a worker that finishes a batch early takes the next batch.
+BATCHES_PER_WORKER = 4
+
+
+def get_num_worker_processes(io_budget_mbps, per_task_mbps):
+    '''
+    * Description:
+      * Returns the number of worker processes to use
+      * It's the number of tasks that fit in the disk-throughput budget, but it's at least 1, 
+        and at most NUM_WORKER_PROCESSES.
+
+    * Input:
+      * io_budget_mbps: disk throughput available to the batch, in MB/s
+      * per_task_mbps: disk throughput used by processing one .yml file, in MB/s
+    '''
+    num_tasks_in_budget = io_budget_mbps // max(1, per_task_mbps)
+    return max(1, min(NUM_WORKER_PROCESSES, num_tasks_in_budget))
+
+# END OF: get_num_worker_processes()
+
+
+def init_worker():
+    '''
+    * Description:
+      * Initializes a worker process.  It's called once, when the worker process starts.
+      * create_web_page, and the modules it uses (e.g., yaml, jinja2, bs4), are imported
+        when this module is loaded in the worker process, i.e., before the first file.
+      * WWN's Jinja template is compiled, and cached in load_html_files.JINJA_TEMPLATE.
+        So, the template isn't compiled while the worker's first file is processed.
+    '''
+    # Errors with the template are reported when the files are processed.  So, here, 
+    # the error messages are discarded.
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_html_files.load_jinja_template()
+    except TemplateError:
+        pass
+
+# END OF: init_worker()
+
+
+def process_yml_files(yml_file_paths):
+    '''
+    * Description:
+      * Calls create_web_page.create_web_page() for each .yml file in a batch of files
+      * It's run in a worker process, so it's a top-level function (it must be picklable).
+      * The batch's results are totaled here, so one set of totals is returned to the 
+        main process, rather than one result per file.
+      * If create_web_page() raises an exception for a file, the file is counted as failed, 
+        and the batch's other files are still processed.
+      * Each file's console output is buffered, and then written with a single write.
+        So, the output for a file isn't interleaved with output from other worker processes.
+
+    * Input:
+      * yml_file_paths: a list of .yml file paths
+
+    * Return:
+      * file_count, failed_file_names, files_with_warning_messages, total_num_warning_messages
+    '''
+    file_count = 0
+    failed_file_names = []
+    files_with_warning_messages = 0
+    total_num_warning_messages = 0
+    for yml_file_path in yml_file_paths:
+        file_count += 1
+        # * The buffered output is written in "finally", so it's written even if 
+        #   create_web_page() raises an exception.
+        file_output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(file_output):
+                print("\nINFO.  Processing the .yml file:  " + os.path.basename(yml_file_path))
+                try:
+                    return_value, num_warning_messages = create_web_page.create_web_page(yml_file_path)
+                except Exception:
+                    print("")
+                    print("ERROR.  Exception in call to create_web_page():")
+                    print("")
+                    traceback.print_exc(file=sys.stdout)
+                    return_value, num_warning_messages = 1, 0
+        finally:
+            sys.stdout.write(file_output.getvalue())
+            sys.stdout.flush()
+        if return_value == 1:
+            failed_file_names.append(os.path.basename(yml_file_path))
+        if (num_warning_messages > 0):
+            files_with_warning_messages += 1
+            total_num_warning_messages += num_warning_messages
+    return file_count, failed_file_names, files_with_warning_messages, total_num_warning_messages
+
+# END OF: process_yml_files()
+
 '''
 #########
 Main
@@ -47,51 +162,70 @@ if __name__ == "__main__":
     arg_parser = create_arg_parser()
     parsed_args = arg_parser.parse_args()
     input_dir_path = parsed_args.input_dir_path
+    num_worker_processes = get_num_worker_processes(parsed_args.io_budget_mbps, 
+                                                    parsed_args.per_task_mbps)
+
+    # For the input directory, create a list of the paths of the files with extension .yml
+    # * os.scandir() returns the directory entries with their file-type and path, so a separate
+    #   stat of each file (e.g., by os.path.isfile()) is not needed.
+    # * The list is needed to plan the batches, below.
+    yml_file_paths = []
+    with os.scandir(input_dir_path) as directory_entries:
+        for directory_entry in directory_entries:
+            if directory_entry.is_file() and \
+               directory_entry.name.lower().endswith(".yml"):
+                yml_file_paths.append(directory_entry.path)
+
+    # At most MAX_FILES_TO_PROCESS files are processed
+    yml_file_paths = yml_file_paths[:MAX_FILES_TO_PROCESS]
 
-    # For the input directory, create a list of files with extension .yml
-    all_files = [item for item in listdir(input_dir_path) if isfile(join(input_dir_path, item))]
-    yml_files = []
-    for file_name in all_files:
-        file_name_root, file_name_extension =  os.path.splitext(file_name)
-        if (file_name_extension.lower() == ".yml"):
-            yml_files.append(file_name)
+    # Plan the work: divide the .yml files into BATCHES_PER_WORKER batches per worker process
+    # * The batches are equal-sized, to within one file.
+    # * The files are dealt out to the batches in turn, so large and small files that are 
+    #   next to each other in the directory are spread across the batches.
+    # * There are more batches than workers, so the work is load-balanced: a worker that 
+    #   finishes a batch early takes the next batch.
+    num_batches = num_worker_processes * BATCHES_PER_WORKER
+    yml_file_batches = [yml_file_paths[batch_index::num_batches] 
+                        for batch_index in range(num_batches)]
+    yml_file_batches = [yml_file_batch for yml_file_batch in yml_file_batches if yml_file_batch]
 
-    # Process each input .yml file
+    # Process the batches of .yml files
+    # * The batches are processed in parallel, by a pool of worker processes.
+    #   The pool's size is num_worker_processes.
+    # * Each worker process is initialized by init_worker()
+    # * Each batch is submitted to the pool as one task, and each batch returns one set of totals.
+    #   as_completed() returns each batch's future as soon as the batch is completed, so 
+    #   the totals are collected while slower batches are still being processed.
     file_count = 0
-    failed_file_count = 0
-    failed_file_names = ""
+    failed_file_names = []
     files_with_warning_messages = 0
     total_num_warning_messages = 0
-    for file_name in yml_files:
-        file_count += 1
-        print("\nINFO.  Processing the .yml file:  " + file_name)
-
-        # Create the file-path for the yml-file 
-        yml_file_path = join(input_dir_path, file_name)
-
-        '''
-        Call create_web_page.main(), pass it the path to the yml-file
-        '''
-        return_value, num_warning_messages = create_web_page.create_web_page(yml_file_path)
-        if return_value == 1:
-            failed_file_count += 1
-            failed_file_names += file_name + ", "
-        if (num_warning_messages > 0):
-            files_with_warning_messages += 1
-            total_num_warning_messages += num_warning_messages
-
-        if (file_count == MAX_FILES_TO_PROCESS):
-            break
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_worker_processes, 
+                                                initializer=init_worker) as executor:
+        futures = [executor.submit(process_yml_files, yml_file_batch) for yml_file_batch in yml_file_batches]
+        for future in concurrent.futures.as_completed(futures):
+            batch_file_count, batch_failed_file_names, batch_files_with_warning_messages, \
+                batch_num_warning_messages = future.result()
+            file_count += batch_file_count
+            failed_file_names += batch_failed_file_names
+            files_with_warning_messages += batch_files_with_warning_messages
+            total_num_warning_messages += batch_num_warning_messages
+    failed_file_count = len(failed_file_names)
 
-    print("\nBatch processing completed.")
-    print("Files processed: " + str(file_count))
-    print("Files processed successfully: " + str(file_count - failed_file_count))    
+    # Write the summary, with a single write to stdout
     if (failed_file_count != 0):
-        failed_files_string = "  File-names: " + failed_file_names
+        failed_files_string = "  File-names: " + ", ".join(failed_file_names)
     else:
         failed_files_string = ""
-    print("Files processed unsuccessfully:  Count:" + str(failed_file_count) + \
-          failed_files_string)
-    print("Number of files with warning messages: " + str(files_with_warning_messages))                        
-    print("Number of warning messages: " + str(total_num_warning_messages))              
-    print("")
\ No newline at end of file
+    summary_lines = [
+        "",
+        "Batch processing completed.",
+        "Files processed: " + str(file_count),
+        "Files processed successfully: " + str(file_count - failed_file_count),
+        "Files processed unsuccessfully:  Count:" + str(failed_file_count) + failed_files_string,
+        "Number of files with warning messages: " + str(files_with_warning_messages),
+        "Number of warning messages: " + str(total_num_warning_messages),
+        ""
+    ]
+    sys.stdout.write("\n".join(summary_lines) + "\n")
\ No newline at end of file